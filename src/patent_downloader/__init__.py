@@ -4,10 +4,18 @@ Patent Downloader SDK
 A Python SDK for downloading patents from Google Patents with MCP support.
 """
 
-from .downloader import PatentDownloader
+from .downloader import PatentDownloader, get_shared_downloader, is_valid_patent_number
 from .models import PatentInfo
 from .exceptions import PatentDownloadError
 from .progress_logger import ProgressLogger, setup_progress_logging
 
 __version__ = "0.4.1"
-__all__ = ["PatentDownloader", "PatentInfo", "PatentDownloadError", "ProgressLogger", "setup_progress_logging"]
+__all__ = [
+    "PatentDownloader",
+    "PatentInfo",
+    "PatentDownloadError",
+    "ProgressLogger",
+    "setup_progress_logging",
+    "is_valid_patent_number",
+    "get_shared_downloader",
+]
@@ -0,0 +1,130 @@
+"""Caching of patent page lookups in memory and optionally on disk."""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+# Suffix of persisted entries, so clear() never touches other files sharing the cache directory
+_ENTRY_SUFFIX = ".patent.json"
+
+
+class PatentCache:
+    """Thread-safe LRU cache of patent lookups with an optional on-disk layer.
+
+    Entries are JSON-serializable dicts keyed by patent number. Each entry records
+    when it was fetched, alongside whatever was resolved for the patent (e.g. the
+    PDF link or the parsed patent information).
+    """
+
+    def __init__(self, maxsize: int = 1024, cache_dir: Optional[str] = None, ttl: float = 86400):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in memory
+            cache_dir: Optional directory for persisting entries across runs
+            ttl: Number of seconds an entry stays fresh (default: one day)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache_dir = Path(os.path.expanduser(cache_dir)) if cache_dir else None
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, patent_number: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cache entry for a patent, or None if missing or expired (unless allow_stale)."""
+        with self._lock:
+            entry = self._entries.get(patent_number)
+            if entry is not None:
+                self._entries.move_to_end(patent_number)
+
+        if entry is None:
+            entry = self._load(patent_number)
+            if entry is None:
+                return None
+            with self._lock:
+                self._store(patent_number, entry)
+
+        if not allow_stale and not self.is_fresh(entry):
+            return None
+        return dict(entry)
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry is still within its time-to-live."""
+        return time.time() - entry.get("fetched_at", 0) <= self.ttl
+
+    def update(self, patent_number: str, **fields: Any) -> None:
+        """Merge fields into the fresh cache entry for a patent (or start a new one) and refresh its timestamp."""
+        entry = self.get(patent_number) or {}
+        entry.update(fields)
+        entry["fetched_at"] = time.time()
+
+        with self._lock:
+            self._store(patent_number, entry)
+        self._save(patent_number, entry)
+
+    def clear(self) -> None:
+        """Remove all in-memory entries and any persisted entries, leaving other files in cache_dir alone."""
+        with self._lock:
+            self._entries.clear()
+
+        if self.cache_dir and self.cache_dir.exists():
+            for path in self.cache_dir.glob(f"*{_ENTRY_SUFFIX}"):
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logger.warning(f"Failed to remove cache file {path}: {e}")
+
+    def _store(self, patent_number: str, entry: Dict[str, Any]) -> None:
+        """Store an entry in memory, evicting the least recently used one if full. Caller holds the lock."""
+        self._entries[patent_number] = entry
+        self._entries.move_to_end(patent_number)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _path(self, patent_number: str) -> Path:
+        """Get the on-disk location of a patent's entry."""
+        assert self.cache_dir is not None
+        return self.cache_dir / f"{quote(patent_number, safe='')}{_ENTRY_SUFFIX}"
+
+    def _load(self, patent_number: str) -> Optional[Dict[str, Any]]:
+        """Load a persisted entry from disk."""
+        if not self.cache_dir:
+            return None
+
+        path = self._path(patent_number)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to load cache file {path}: {e}")
+            return None
+
+    def _save(self, patent_number: str, entry: Dict[str, Any]) -> None:
+        """Persist an entry to disk, replacing the file atomically."""
+        if not self.cache_dir:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp_path, self._path(patent_number))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to save cache file for {patent_number}: {e}")
@@ -3,24 +3,53 @@
 import argparse
 import sys
 
+from .daemon import DEFAULT_SOCKET_PATH, daemon_available, serve, submit_jobs
 from .downloader import PatentDownloader
 from .exceptions import PatentDownloadError
 from .progress_logger import setup_progress_logging, get_progress_logger
 from .file_utils import read_patent_numbers_from_file
 
 
-def print_progress_bar(completed: int, total: int, patent_number: str, success: bool):
-    """Print a progress bar using modern UI with proper log coordination."""
-    progress_logger = get_progress_logger()
-    progress_logger.update_progress(completed, total, patent_number, success)
-
-
 def download_command(args: argparse.Namespace) -> int:
     """Handle the download command."""
     progress_logger = get_progress_logger()
 
     try:
-        downloader = PatentDownloader(max_retries=args.max_retries, progress_logger=progress_logger)
+        downloader = PatentDownloader(
+            max_retries=args.max_retries,
+            progress_logger=progress_logger,
+            max_workers=args.max_workers,
+            cache_dir=args.cache_dir,
+        )
+
+        # Hand the jobs to a running daemon when asked to, so its warm session and caches are reused
+        use_daemon = args.daemon and daemon_available()
+        if use_daemon:
+            progress_logger.log_message("Forwarding downloads to the running daemon...")
+            # The daemon downloads with the settings it was started with
+            ignored = [
+                flag
+                for flag, is_set in (
+                    ("--max-retries", args.max_retries != 3),
+                    ("--max-workers", args.max_workers != 8),
+                    ("--cache-dir", args.cache_dir is not None),
+                    ("--verbose", args.verbose > 0),
+                )
+                if is_set
+            ]
+            if ignored:
+                progress_logger.log_message(
+                    f"The daemon uses its own settings; ignoring {', '.join(ignored)}", "warning"
+                )
+        elif args.daemon:
+            progress_logger.log_message("No download daemon is running; downloading in this process", "warning")
+
+        def download_many(patent_numbers):
+            if use_daemon:
+                return submit_jobs(patent_numbers, args.output_dir, progress_callback=progress_logger.update_progress)
+            return downloader.download_patents(
+                patent_numbers, args.output_dir, progress_callback=progress_logger.update_progress
+            )
 
         # Get patent numbers from file or command line arguments
         if args.file:
@@ -30,9 +59,7 @@ def download_command(args: argparse.Namespace) -> int:
             if total > 0:
                 progress_logger.start_progress(total)
 
-            results = downloader.download_patents_from_file(
-                args.file, args.has_header, args.output_dir, progress_callback=print_progress_bar
-            )
+            results = download_many(patent_numbers)
 
             # Finish progress tracking
             progress_logger.finish_progress()
@@ -53,7 +80,10 @@ def download_command(args: argparse.Namespace) -> int:
             if len(patent_numbers) == 1:
                 # Single patent download
                 progress_logger.log_message(f"Downloading patent {patent_numbers[0]}...")
-                success = downloader.download_patent(patent_numbers[0], args.output_dir)
+                if use_daemon:
+                    success = submit_jobs(patent_numbers, args.output_dir)[patent_numbers[0]]
+                else:
+                    success = downloader.download_patent(patent_numbers[0], args.output_dir)
                 if success:
                     progress_logger.log_message(f"Successfully downloaded patent {patent_numbers[0]}", "success")
                     return 0
@@ -66,9 +96,7 @@ def download_command(args: argparse.Namespace) -> int:
                 progress_logger.log_message(f"Starting download of {total} patents...")
                 progress_logger.start_progress(total)
 
-                results = downloader.download_patents(
-                    patent_numbers, args.output_dir, progress_callback=print_progress_bar
-                )
+                results = download_many(patent_numbers)
 
                 # Finish progress tracking
                 progress_logger.finish_progress()
@@ -86,12 +114,15 @@ def download_command(args: argparse.Namespace) -> int:
                 return 0 if not failed else 1
 
     except PatentDownloadError as e:
+        progress_logger.flush()
         print(f"Error: {e}")
         return 1
     except KeyboardInterrupt:
+        progress_logger.flush()
         print("\nDownload interrupted by user")
         return 1
     except Exception as e:
+        progress_logger.flush()
         print(f"Unexpected error: {e}")
         return 1
 
@@ -101,19 +132,25 @@ def info_command(args: argparse.Namespace) -> int:
     progress_logger = get_progress_logger()
 
     try:
-        downloader = PatentDownloader(max_retries=args.max_retries, progress_logger=progress_logger)
+        downloader = PatentDownloader(
+            max_retries=args.max_retries, progress_logger=progress_logger, cache_dir=args.cache_dir
+        )
         progress_logger.log_message(f"Fetching information for patent {args.patent_number}...")
         patent_info = downloader.get_patent_info(args.patent_number)
 
-        # Force show user results (important information)
-        progress_logger.log_message(f"Patent Information for {args.patent_number}:", force_show=True)
-        progress_logger.log_message(f"  Title: {patent_info.title}", force_show=True)
-        progress_logger.log_message(f"  Inventors: {', '.join(patent_info.inventors)}", force_show=True)
-        progress_logger.log_message(f"  Assignee: {patent_info.assignee}", force_show=True)
-        progress_logger.log_message(f"  Publication Date: {patent_info.publication_date}", force_show=True)
-        progress_logger.log_message(f"  URL: {patent_info.url}", force_show=True)
+        # Force show user results (important information), written out as one message
+        lines = [
+            f"Patent Information for {args.patent_number}:",
+            f"  Title: {patent_info.title}",
+            f"  Inventors: {', '.join(patent_info.inventors)}",
+            f"  Assignee: {patent_info.assignee}",
+            f"  Publication Date: {patent_info.publication_date}",
+            f"  URL: {patent_info.url}",
+        ]
         if patent_info.abstract:
-            progress_logger.log_message(f"  Abstract: {patent_info.abstract[:200]}...", force_show=True)
+            abstract_preview = patent_info.abstract[:200]
+            lines.append(f"  Abstract: {abstract_preview}...")
+        progress_logger.log_message("\n".join(lines), force_show=True)
 
         return 0
 
@@ -133,6 +170,8 @@ def mcp_server_command(_: argparse.Namespace) -> int:
         from .mcp_server import start_mcp_server
 
         progress_logger.log_message("Starting MCP server...")
+        # The stdio transport takes over stdout, so write out anything still queued first
+        progress_logger.flush()
         start_mcp_server()
         return 0
     except ImportError:
@@ -145,6 +184,22 @@ def mcp_server_command(_: argparse.Namespace) -> int:
         return 1
 
 
+def daemon_command(args: argparse.Namespace) -> int:
+    """Handle the daemon command."""
+    progress_logger = get_progress_logger()
+
+    try:
+        progress_logger.log_message(f"Starting download daemon on {DEFAULT_SOCKET_PATH}...")
+        serve(max_workers=args.max_workers, max_retries=args.max_retries, cache_dir=args.cache_dir)
+        return 0
+    except KeyboardInterrupt:
+        progress_logger.log_message("Daemon stopped by user")
+        return 0
+    except Exception as e:
+        progress_logger.log_message(f"Error running daemon: {e}", "error")
+        return 1
+
+
 def main() -> int:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -158,6 +213,7 @@ Examples:
   patent-downloader download --file patents.csv
   patent-downloader info WO2013078254A1
   patent-downloader mcp-server --port 8000
+  patent-downloader daemon
         """,
     )
 
@@ -186,6 +242,15 @@ Examples:
     download_parser.add_argument(
         "--max-retries", type=int, default=3, help="Maximum number of retry attempts for failed downloads (default: 3)"
     )
+    download_parser.add_argument(
+        "--max-workers", type=int, default=8, help="Maximum number of concurrent downloads (default: 8)"
+    )
+    download_parser.add_argument(
+        "--cache-dir", help="Directory for caching patent lookups across runs (default: no persistent cache)"
+    )
+    download_parser.add_argument(
+        "--daemon", action="store_true", help="Forward the downloads to a running daemon (see the daemon command)"
+    )
     download_parser.set_defaults(func=download_command)
 
     # Info command
@@ -194,6 +259,9 @@ Examples:
     info_parser.add_argument(
         "--max-retries", type=int, default=3, help="Maximum number of retry attempts for failed requests (default: 3)"
     )
+    info_parser.add_argument(
+        "--cache-dir", help="Directory for caching patent lookups across runs (default: no persistent cache)"
+    )
     info_parser.set_defaults(func=info_command)
 
     # MCP server command
@@ -202,6 +270,21 @@ Examples:
     mcp_parser.add_argument("--port", type=int, default=8000, help="Port to bind to (default: 8000)")
     mcp_parser.set_defaults(func=mcp_server_command)
 
+    # Daemon command
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="Run a background downloader that download --daemon forwards its jobs to"
+    )
+    daemon_parser.add_argument(
+        "--max-workers", type=int, default=8, help="Maximum number of concurrent downloads (default: 8)"
+    )
+    daemon_parser.add_argument(
+        "--max-retries", type=int, default=3, help="Maximum number of retry attempts for failed downloads (default: 3)"
+    )
+    daemon_parser.add_argument(
+        "--cache-dir", help="Directory for caching patent lookups across runs (default: no persistent cache)"
+    )
+    daemon_parser.set_defaults(func=daemon_command)
+
     args = parser.parse_args()
 
     if not args.command:
@@ -220,9 +303,13 @@ Examples:
             return 1
 
     # Setup logging with progress bar support
-    setup_progress_logging(args.verbose)
+    progress_logger = setup_progress_logging(args.verbose)
 
-    return args.func(args)
+    try:
+        return args.func(args)
+    finally:
+        # Output is written by a background thread; make sure it has all landed before returning
+        progress_logger.flush()
 
 
 if __name__ == "__main__":
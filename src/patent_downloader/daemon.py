@@ -0,0 +1,239 @@
+"""Background daemon that keeps one PatentDownloader alive across CLI invocations.
+
+The daemon listens on a Unix socket, kept in a directory only its owner can
+access, for newline-delimited JSON jobs of the form
+``{"patent_number": ..., "output_dir": ...}`` and answers each one with
+``{"patent_number": ..., "success": ...}`` as soon as it finishes, so repeated
+CLI calls reuse the same session, connection pools and caches.
+"""
+
+import concurrent.futures
+import json
+import logging
+import os
+import socket
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .downloader import PatentDownloader
+
+logger = logging.getLogger(__name__)
+
+# Socket inside a directory only the current user can enter: the per-user runtime directory when
+# there is one, otherwise a private 0700 directory under the system temp dir
+DEFAULT_SOCKET_PATH = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR")
+    or os.path.join(
+        tempfile.gettempdir(),
+        f"patent_downloader-{os.getuid()}" if hasattr(os, "getuid") else "patent_downloader",
+    ),
+    "patent_downloader.sock",
+)
+
+# Seconds between checks of serve()'s stop_event
+STOP_POLL_INTERVAL = 0.5
+
+
+def is_supported() -> bool:
+    """Check whether the platform supports Unix domain sockets and per-user ownership checks."""
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Check that a file or directory is owned by the current user and closed to everyone else."""
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def _is_trusted_socket(socket_path: str) -> bool:
+    """Check that the socket and its directory belong to the current user, so jobs never go to someone else."""
+    try:
+        socket_stat = os.lstat(socket_path)
+        dir_stat = os.lstat(os.path.dirname(os.path.abspath(socket_path)))
+    except OSError:
+        return False
+
+    return (
+        stat.S_ISSOCK(socket_stat.st_mode)
+        and socket_stat.st_uid == os.getuid()
+        and stat.S_ISDIR(dir_stat.st_mode)
+        and _is_private(dir_stat)
+    )
+
+
+def _prepare_socket_dir(socket_path: str) -> None:
+    """Create the socket's directory with owner-only permissions and refuse to use one anyone else controls."""
+    socket_dir = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+
+    dir_stat = os.lstat(socket_dir)
+    if not stat.S_ISDIR(dir_stat.st_mode) or not _is_private(dir_stat):
+        raise RuntimeError(f"Refusing to use {socket_dir}: it must be a directory owned by you with mode 0700")
+
+
+def daemon_available(socket_path: str = DEFAULT_SOCKET_PATH) -> bool:
+    """Check whether a daemon owned by the current user is accepting connections on the socket."""
+    if not is_supported() or not _is_trusted_socket(socket_path):
+        return False
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+
+def serve(
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    max_workers: int = 8,
+    stop_event: Optional[threading.Event] = None,
+    **downloader_kwargs,
+) -> None:
+    """
+    Serve download jobs on a Unix socket until interrupted or stop_event is set.
+
+    Args:
+        socket_path: Path of the Unix socket to listen on
+        max_workers: Maximum number of concurrent downloads across all clients
+        stop_event: Optional event that shuts the daemon down once set (checked every STOP_POLL_INTERVAL seconds)
+        **downloader_kwargs: Extra arguments for the shared PatentDownloader
+
+    Raises:
+        RuntimeError: If Unix sockets are unsupported, the socket directory is not private,
+            or a daemon is already running
+    """
+    if not is_supported():
+        raise RuntimeError("Daemon mode requires Unix domain socket support")
+
+    _prepare_socket_dir(socket_path)
+    if os.path.lexists(socket_path):
+        if daemon_available(socket_path):
+            raise RuntimeError(f"A daemon is already listening on {socket_path}")
+        os.unlink(socket_path)  # Stale socket left by a daemon that didn't shut down cleanly
+
+    downloader = PatentDownloader(max_workers=max_workers, **downloader_kwargs)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        # Only the owner may submit jobs
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(socket_path)
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        # Wake up regularly so a stop request is noticed even when no client connects
+        server.settimeout(STOP_POLL_INTERVAL)
+        logger.info(f"Daemon listening on {socket_path}")
+
+        while stop_event is None or not stop_event.is_set():
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+            conn.settimeout(None)
+            threading.Thread(target=_handle_connection, args=(conn, downloader, executor), daemon=True).start()
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        executor.shutdown(wait=False, cancel_futures=True)
+        downloader.close()
+
+
+def _handle_connection(
+    conn: socket.socket, downloader: PatentDownloader, executor: concurrent.futures.ThreadPoolExecutor
+) -> None:
+    """Run the jobs sent on one connection, replying to each as it completes."""
+    write_lock = threading.Lock()
+    futures = []
+
+    def run_job(patent_number: str, output_dir: str) -> None:
+        """Download one patent and send its result back to the client."""
+        try:
+            success = downloader.download_patent(patent_number, output_dir)
+        except Exception:
+            success = False
+
+        line = json.dumps({"patent_number": patent_number, "success": success}).encode() + b"\n"
+        with write_lock:
+            try:
+                conn.sendall(line)
+            except OSError:
+                pass  # Client went away; keep processing its remaining jobs
+
+    with conn, conn.makefile("rb") as reader:
+        for raw_line in reader:
+            try:
+                job = json.loads(raw_line)
+                patent_number = job["patent_number"]
+                output_dir = job.get("output_dir", ".")
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring malformed job: {e}")
+                continue
+
+            futures.append(executor.submit(run_job, patent_number, output_dir))
+
+        concurrent.futures.wait(futures)
+
+
+def submit_jobs(
+    patent_numbers: List[str],
+    output_dir: str = ".",
+    progress_callback: Optional[Callable[[int, int, str, bool], None]] = None,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+) -> Dict[str, bool]:
+    """
+    Send download jobs to a running daemon and wait for the results.
+
+    Args:
+        patent_numbers: List of patent numbers to download
+        output_dir: Directory to save the PDF files
+        progress_callback: Callback function for progress updates
+            Signature: (completed: int, total: int, patent_number: str, success: bool) -> None
+        socket_path: Path of the daemon's Unix socket
+
+    Returns:
+        Dict mapping patent numbers to success status
+
+    Raises:
+        OSError: If the daemon cannot be reached or its socket is not owned by the current user
+    """
+    if not _is_trusted_socket(socket_path):
+        raise PermissionError(f"Daemon socket {socket_path} is missing or not owned by the current user")
+
+    # Send each patent once, like download_patents; duplicates would also race writing the same file
+    patent_numbers = list(dict.fromkeys(patent_numbers))
+    # The daemon has its own working directory, so always send an absolute path
+    output_dir = str(Path(os.path.expanduser(output_dir)).resolve())
+    jobs = b"".join(
+        json.dumps({"patent_number": pn, "output_dir": output_dir}).encode() + b"\n" for pn in patent_numbers
+    )
+
+    results: Dict[str, bool] = {}
+    completed = 0
+    total = len(patent_numbers)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(jobs)
+        sock.shutdown(socket.SHUT_WR)
+
+        with sock.makefile("rb") as reader:
+            for line in reader:
+                result = json.loads(line)
+                patent_number, success = result["patent_number"], bool(result["success"])
+                results[patent_number] = success
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total, patent_number, success)
+
+    # Jobs the daemon never answered (e.g. it was stopped mid-batch) count as failures
+    for patent_number in patent_numbers:
+        results.setdefault(patent_number, False)
+
+    return results
@@ -1,17 +1,26 @@
 """Main patent downloader implementation."""
 
+import asyncio
+import atexit
+from bisect import bisect_right
 import os
+import re
 import requests
+from dataclasses import asdict, dataclass
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import Any, Dict, Iterable, List, Optional, Callable, Set, Sized, Tuple
 from bs4 import BeautifulSoup
 import logging
 import concurrent.futures
 import threading
 import time
-from functools import wraps
+from functools import cached_property, lru_cache, wraps
+from html import unescape
+from html.parser import HTMLParser
 
-from .file_utils import read_patent_numbers_from_file
+from .cache import PatentCache
+from .file_utils import iter_patent_numbers_from_file
 from .exceptions import (
     PatentDownloadError,
     PatentNotFoundError,
@@ -23,6 +32,89 @@ from .models import PatentInfo
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-backed lxml tree builder when it is installed
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Chunk size for reading PDF bodies and buffering them to disk
+READ_CHUNK = 128 * 1024
+
+# Amount of PDF data gathered before issuing a single vectored write
+WRITE_BATCH = 1024 * 1024
+
+# Most buffers a single os.writev call accepts (IOV_MAX); small chunks must not exceed it before WRITE_BATCH fills
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+# Country code, optional series letters (e.g. USRE, USD, JPH), serial number and optional kind code
+_PATENT_NUMBER_RE = re.compile(r"^[A-Z]{2}[A-Z]{0,2}\d{4,}(?:[A-Z]\d?)?$")
+
+# Anchors whose href mentions "pdf", capturing the href and any plain text right after the opening tag
+_PDF_ANCHOR_RE = re.compile(rb"""<a\s(?:[^>]*?\s)?href\s*=\s*["']([^"']*pdf[^"']*)["'][^>]*>([^<]*)""", re.IGNORECASE)
+
+# Comments and script/style bodies, whose markup is not part of the DOM (an unclosed one runs to the end)
+_NON_DOM_RE = re.compile(rb"<!--.*?(?:-->|\Z)|<(script|style)\b.*?(?:</\1\s*>|\Z)", re.IGNORECASE | re.DOTALL)
+
+
+def is_valid_patent_number(patent_number: str) -> bool:
+    """
+    Check whether a string looks like a patent publication number (e.g. "WO2013078254A1").
+
+    Useful for filtering a list of patent numbers before scheduling downloads.
+
+    Args:
+        patent_number: The patent number to check
+
+    Returns:
+        bool: True if the patent number has a valid format
+    """
+    return isinstance(patent_number, str) and _PATENT_NUMBER_RE.match(patent_number.strip().upper()) is not None
+
+
+# Headers sent with every request besides the User-Agent
+_BASE_HEADERS = {
+    "Accept": "application/pdf,application/octet-stream,*/*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+}
+
+
+@lru_cache(maxsize=2048)
+def _pdf_request_headers(user_agent: str, referer: str) -> Dict[str, str]:
+    """Build the headers for a PDF request. The dict is shared between calls, so it must not be mutated."""
+    # PDFs are already compressed, so ask for them as-is rather than paying to inflate a gzip layer
+    return {"User-Agent": user_agent, **_BASE_HEADERS, "Referer": referer, "Accept-Encoding": "identity"}
+
+
+def _writev_all(fd: int, buffers: List[bytes]) -> None:
+    """Write all buffers to a file descriptor with os.writev, resuming after partial writes."""
+    views = [memoryview(buffer) for buffer in buffers]
+    while views:
+        written = os.writev(fd, views)
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            views.pop(0)
+        if views and written:
+            views[0] = views[0][written:]
+
+
+def _non_dom_spans(content: bytes) -> Tuple[List[int], List[int]]:
+    """Get the start and end offsets of the comments and script/style bodies in raw HTML."""
+    starts: List[int] = []
+    ends: List[int] = []
+    for match in _NON_DOM_RE.finditer(content):
+        starts.append(match.start())
+        ends.append(match.end())
+    return starts, ends
+
 
 def retry_on_network_error(max_retries: int = 3, backoff_factor: float = 1.0):
     """
@@ -71,10 +163,193 @@ def retry_on_network_error(max_retries: int = 3, backoff_factor: float = 1.0):
     return decorator
 
 
+# Elements holding patent information, keyed by (tag, itemprop), and the field each one fills
+_INFO_ITEMPROPS = {
+    ("span", "title"): "title",
+    ("span", "inventor"): "inventors",
+    ("span", "assignee"): "assignee",
+    ("time", "publicationDate"): "publication_date",
+    ("div", "abstract"): "abstract",
+}
+
+
+# Elements that never have a closing tag, so they are not tracked as open
+_VOID_ELEMENTS = frozenset(
+    ["area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"]
+)
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+_NON_TEXT_ELEMENTS = frozenset(["script", "style", "template"])
+
+
+class _PatentInfoParser(HTMLParser):
+    """Single-pass extractor for the text of a patent page's itemprop fields, without building a DOM.
+
+    Collects the text of every inventor element and of the first element for each other
+    field (plus the first h1, the title fallback), including text in nested elements. Like
+    get_text(), text inside script, style and template elements is skipped, and an element
+    left unclosed ends when an enclosing element closes.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.texts: Dict[str, List[str]] = {}
+        # Tags of the currently open elements, outermost first
+        self._stack: List[str] = []
+        # Number of open script/style/template elements
+        self._skipping = 0
+        # Elements being captured, as (stack position of the element, field, text parts)
+        self._open: List[Tuple[int, str, List[str]]] = []
+        self._started: Set[str] = set()
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        """Track open elements and start capturing wanted ones."""
+        if tag in _VOID_ELEMENTS:
+            return
+
+        if tag == "h1":
+            field = "h1"
+        elif tag in ("span", "time", "div"):
+            itemprop = next((value for name, value in attrs if name == "itemprop"), None)
+            field = _INFO_ITEMPROPS.get((tag, itemprop))
+        else:
+            field = None
+
+        if field and (field == "inventors" or field not in self._started):
+            self._started.add(field)
+            self._open.append((len(self._stack), field, []))
+
+        self._stack.append(tag)
+        if tag in _NON_TEXT_ELEMENTS:
+            self._skipping += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        """Close the element (and any unclosed elements inside it), finishing captures that end with it."""
+        if tag not in self._stack:
+            return  # Stray closing tag
+
+        while True:
+            closed = self._stack.pop()
+            if closed in _NON_TEXT_ELEMENTS:
+                self._skipping -= 1
+            if closed == tag:
+                break
+
+        depth = len(self._stack)
+        while self._open and self._open[-1][0] >= depth:
+            self._finish(self._open.pop())
+
+    def handle_data(self, data: str) -> None:
+        """Add text to every element being captured."""
+        if self._skipping:
+            return
+
+        for _, _, parts in self._open:
+            parts.append(data)
+
+    def close(self) -> None:
+        """Finish parsing, keeping the text of elements left unclosed at the end of the page."""
+        super().close()
+        for capture in self._open:
+            self._finish(capture)
+        self._open = []
+
+    def _finish(self, capture: Tuple[int, str, List[str]]) -> None:
+        """Record the text of a finished capture."""
+        _, field, parts = capture
+        self.texts.setdefault(field, []).append("".join(parts))
+
+
+@dataclass
+class _ParsedPage:
+    """A fetched patent page whose DOM is built on first use and whose fields are extracted at most once."""
+
+    content: bytes
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """Parsed DOM of the page."""
+        return BeautifulSoup(self.content, HTML_PARSER)
+
+    @cached_property
+    def _texts(self) -> Dict[str, List[str]]:
+        """Text of the itemprop fields, gathered in one streaming pass over the page."""
+        parser = _PatentInfoParser()
+        parser.feed(self.content.decode("utf-8", errors="replace"))
+        parser.close()
+        return parser.texts
+
+    @cached_property
+    def title(self) -> str:
+        """Patent title."""
+        if "title" in self._texts:
+            return self._texts["title"][0].strip()
+
+        # Fallback to h1
+        if "h1" in self._texts:
+            return self._texts["h1"][0].strip()
+
+        return "Unknown Title"
+
+    @cached_property
+    def inventors(self) -> List[str]:
+        """Inventor names."""
+        inventors = []
+        for text in self._texts.get("inventors", []):
+            name = text.strip()
+            if name:
+                inventors.append(name)
+
+        return inventors
+
+    @cached_property
+    def assignee(self) -> str:
+        """Assignee information."""
+        if "assignee" in self._texts:
+            return self._texts["assignee"][0].strip()
+
+        return "Unknown Assignee"
+
+    @cached_property
+    def publication_date(self) -> str:
+        """Publication date."""
+        if "publication_date" in self._texts:
+            return self._texts["publication_date"][0].strip()
+
+        return "Unknown Date"
+
+    @cached_property
+    def abstract(self) -> str:
+        """Patent abstract."""
+        if "abstract" in self._texts:
+            return self._texts["abstract"][0].strip()
+
+        return "No abstract available"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the extracted patent fields as keyword arguments for PatentInfo."""
+        return {
+            "title": self.title,
+            "inventors": self.inventors,
+            "assignee": self.assignee,
+            "publication_date": self.publication_date,
+            "abstract": self.abstract,
+        }
+
+
 class PatentDownloader:
     """Main class for downloading patents from Google Patents."""
 
-    def __init__(self, timeout: int = 30, user_agent: Optional[str] = None, max_retries: int = 3, progress_logger=None):
+    def __init__(
+        self,
+        timeout: int = 30,
+        user_agent: Optional[str] = None,
+        max_retries: int = 3,
+        progress_logger=None,
+        max_workers: int = 8,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = 86400,
+    ):
         """
         Initialize the patent downloader.
 
@@ -83,6 +358,9 @@ class PatentDownloader:
             user_agent: Custom user agent string
             max_retries: Maximum number of retry attempts for failed requests (default: 3)
             progress_logger: Optional ProgressLogger instance for coordinated logging
+            max_workers: Default number of concurrent downloads, also used to size the connection pool (default: 8)
+            cache_dir: Optional directory for persisting patent lookups across runs (default: memory only)
+            cache_ttl: Number of seconds cached patent lookups stay fresh (default: one day)
         """
         self.timeout = timeout
         self.user_agent = user_agent or (
@@ -92,14 +370,19 @@ class PatentDownloader:
         )
         self.max_retries = max_retries
         self.progress_logger = progress_logger
+        self.max_workers = max_workers
+        self.cache = PatentCache(cache_dir=cache_dir, ttl=cache_ttl)
+        # Recently fetched pages, so download and info lookups in the same batch share one fetch
+        self._page_cache = PatentCache(maxsize=32, ttl=300)
+        # Output directories already created, so batches don't re-create them for every patent
+        self._output_paths: Set[str] = set()
         self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": self.user_agent,
-                "Accept": "application/pdf,application/octet-stream,*/*",
-                "Accept-Language": "en-US,en;q=0.9",
-            }
-        )
+        # Size the connection pool to match the worker count so concurrent downloads reuse connections;
+        # retries stay with retry_on_network_error so they don't multiply across layers
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": self.user_agent, **_BASE_HEADERS})
 
     @retry_on_network_error(max_retries=3)
     def download_patent_data(self, patent_number: str) -> bytes:
@@ -137,9 +420,7 @@ class PatentDownloader:
 
             patent_url = f"https://patents.google.com/patent/{patent_number}/en"
 
-            # Expand ~ to home directory
-            output_path = Path(os.path.expanduser(output_dir))
-            output_path.mkdir(parents=True, exist_ok=True)
+            output_path = self._ensure_dir(output_dir)
 
             pdf_link = self._retrieve_pdf_link(patent_number, patent_url)
 
@@ -156,55 +437,145 @@ class PatentDownloader:
         except Exception as e:
             raise DownloadFailedError(f"Unexpected error: {e}") from e
 
+    async def adownload_patent(self, patent_number: str, output_dir: str = ".") -> bool:
+        """
+        Download a single patent from within an asyncio event loop.
+
+        The download runs in a worker thread on the shared session, so the event loop stays
+        responsive. Arguments, return value and exceptions are the same as download_patent.
+        """
+        return await asyncio.to_thread(self.download_patent, patent_number, output_dir)
+
     def download_patents(
         self,
-        patent_numbers: List[str],
+        patent_numbers: Iterable[str],
         output_dir: str = ".",
         progress_callback: Optional[Callable[[int, int, str, bool], None]] = None,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, bool]:
         """
         Download multiple patents using thread-based concurrency.
 
+        Patent numbers are consumed lazily, so downloads start while a large iterable
+        (e.g. a file being read) is still producing numbers.
+
         Args:
-            patent_numbers: List of patent numbers to download
+            patent_numbers: Patent numbers to download (a list or any iterable)
             output_dir: Directory to save the PDF files
             progress_callback: Callback function for progress updates
                 Signature: (completed: int, total: int, patent_number: str, success: bool) -> None
+                total is 0 when patent_numbers has no known length
+            max_workers: Maximum number of concurrent downloads (default and upper bound: the downloader's max_workers)
 
         Returns:
             Dict mapping patent numbers to success status
         """
-        results = {}
-        results_lock = threading.Lock()
-        max_workers = 4  # Fixed number of workers
+        self._ensure_dir(output_dir)
+        results: Dict[str, bool] = {}
         completed = 0
-        total = len(patent_numbers)
-
-        def download_single_patent(patent_number: str) -> None:
-            """Download a single patent and store result with thread safety."""
+        max_workers = self._pool_workers(max_workers)
+        if isinstance(patent_numbers, Sized):
+            patent_numbers = list(dict.fromkeys(patent_numbers))
+            total = len(patent_numbers)
+            if not patent_numbers:
+                return results
+            # Don't size the pool (or its submission window) beyond the work available
+            max_workers = min(max_workers, total)
+        else:
+            total = 0
+        futures: Dict[concurrent.futures.Future, str] = {}
+        seen: Set[str] = set()
+
+        def record(patent_number: str, success: bool) -> None:
+            """Record a finished download; runs on the calling thread, so the callback needs no locking."""
             nonlocal completed
-            try:
-                success = self.download_patent(patent_number, output_dir)
-                with results_lock:
-                    results[patent_number] = success
-                    completed += 1
-                    if progress_callback:
-                        progress_callback(completed, total, patent_number, success)
-            except Exception:
-                with results_lock:
-                    results[patent_number] = False
-                    completed += 1
-                    if progress_callback:
-                        progress_callback(completed, total, patent_number, False)
-
-        # Use ThreadPoolExecutor for concurrent downloads
+            results[patent_number] = success
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, patent_number, success)
+
+        def collect(done: Iterable[concurrent.futures.Future]) -> None:
+            """Record the downloads of finished futures."""
+            for future in done:
+                patent_number = futures.pop(future)
+                try:
+                    success = future.result()
+                except Exception:
+                    success = False
+                record(patent_number, success)
+
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all download tasks
-            futures = [executor.submit(download_single_patent, patent_number) for patent_number in patent_numbers]
+            for patent_number in patent_numbers:
+                # Fetch each patent once; duplicates would also race writing the same file
+                if patent_number in seen:
+                    continue
+                seen.add(patent_number)
+
+                # Malformed numbers fail straight away instead of taking a trip through the pool
+                if not is_valid_patent_number(patent_number):
+                    record(patent_number, False)
+                    continue
+
+                # Keep only a bounded number of downloads queued ahead of the workers
+                if len(futures) >= max_workers * 2:
+                    done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                    collect(done)
+                futures[executor.submit(self.download_patent, patent_number, output_dir)] = patent_number
+
+            collect(concurrent.futures.as_completed(futures))
+
+        return results
+
+    async def adownload_patents(
+        self,
+        patent_numbers: List[str],
+        output_dir: str = ".",
+        progress_callback: Optional[Callable[[int, int, str, bool], None]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, bool]:
+        """
+        Download multiple patents concurrently from within an asyncio event loop.
+
+        Downloads run in worker threads on the shared session, bounded by a semaphore,
+        so the event loop stays responsive while patents are being fetched.
 
-            # Wait for all tasks to complete
-            concurrent.futures.wait(futures)
+        Args:
+            patent_numbers: List of patent numbers to download
+            output_dir: Directory to save the PDF files
+            progress_callback: Callback function for progress updates
+                Signature: (completed: int, total: int, patent_number: str, success: bool) -> None
+            max_workers: Maximum number of concurrent downloads (default and upper bound: the downloader's max_workers)
+
+        Returns:
+            Dict mapping patent numbers to success status
+        """
+        self._ensure_dir(output_dir)
+        semaphore = asyncio.Semaphore(self._pool_workers(max_workers))
+        results: Dict[str, bool] = {}
+        completed = 0
+        # Fetch each patent once; duplicates would also race writing the same file
+        patent_numbers = list(dict.fromkeys(patent_numbers))
+        total = len(patent_numbers)
 
+        async def download_single_patent(patent_number: str) -> None:
+            """Download a single patent once a concurrency slot is free."""
+            nonlocal completed
+            if not is_valid_patent_number(patent_number):
+                # Malformed numbers fail straight away instead of taking a worker thread
+                success = False
+            else:
+                async with semaphore:
+                    try:
+                        success = await asyncio.to_thread(self.download_patent, patent_number, output_dir)
+                    except Exception:
+                        success = False
+
+            results[patent_number] = success
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, patent_number, success)
+
+        await asyncio.gather(*(download_single_patent(patent_number) for patent_number in patent_numbers))
         return results
 
     def download_patents_from_file(
@@ -213,6 +584,7 @@ class PatentDownloader:
         has_header: bool = False,
         output_dir: str = ".",
         progress_callback: Optional[Callable[[int, int, str, bool], None]] = None,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, bool]:
         """
         Download patents from a file (txt or csv).
@@ -223,6 +595,7 @@ class PatentDownloader:
             output_dir: Directory to save the PDF files
             progress_callback: Callback function for progress updates
                 Signature: (completed: int, total: int, patent_number: str, success: bool) -> None
+            max_workers: Maximum number of concurrent downloads (default and upper bound: the downloader's max_workers)
 
         Returns:
             Dict mapping patent numbers to success status
@@ -233,8 +606,14 @@ class PatentDownloader:
         """
 
         try:
-            patent_numbers = read_patent_numbers_from_file(file_path, has_header)
-            return self.download_patents(patent_numbers, output_dir, progress_callback)
+            # Stream the file so downloads start before the whole list has been read; malformed rows
+            # are recorded as failures rather than aborting the batch after earlier downloads finished
+            patent_numbers = iter_patent_numbers_from_file(file_path, has_header, strict=False)
+            results = self.download_patents(patent_numbers, output_dir, progress_callback, max_workers)
+
+            if not results:
+                raise ValueError("File contains no patent numbers")
+            return results
 
         except FileNotFoundError:
             raise
@@ -260,25 +639,69 @@ class PatentDownloader:
         try:
             self._validate_patent_number(patent_number)
 
+            cached = self.cache.get(patent_number, allow_stale=True)
+            if not (cached and cached.get("info")):
+                cached = None
+            elif self.cache.is_fresh(cached):
+                return PatentInfo(**cached["info"])
+
             patent_url = f"https://patents.google.com/patent/{patent_number}/en"
-            response = self.session.get(patent_url, timeout=self.timeout)
-            response.raise_for_status()
+            page = self._fetch_page(patent_number, patent_url, cached)
+
+            if page is None:
+                # Page unchanged since it was cached
+                self.cache.update(patent_number, **cached)
+                return PatentInfo(**cached["info"])
 
-            return self._parse_patent_info(response.content, patent_number, patent_url)
+            # Parse the page once and cache the PDF link too, so a later download skips the fetch
+            parsed = _ParsedPage(page["content"])
+            patent_info = self._parse_patent_info(parsed, patent_number, patent_url)
+            pdf_link = self._find_pdf_link(parsed, patent_number)
+            self.cache.update(patent_number, info=asdict(patent_info), pdf_link=pdf_link, **self._validators(page))
+            return patent_info
 
         except requests.RequestException as e:
             raise NetworkError(f"Network error: {e}") from e
         except Exception as e:
             raise PatentNotFoundError(f"Could not retrieve patent info: {e}") from e
 
+    async def aget_patent_info(self, patent_number: str) -> PatentInfo:
+        """
+        Get information about a patent from within an asyncio event loop.
+
+        The lookup runs in a worker thread on the shared session, so the event loop stays
+        responsive. Arguments, return value and exceptions are the same as get_patent_info.
+        """
+        return await asyncio.to_thread(self.get_patent_info, patent_number)
+
+    def clear_cache(self) -> None:
+        """Forget all cached patent lookups and pages, including any persisted in the cache directory."""
+        self.cache.clear()
+        self._page_cache.clear()
+
+    def _pool_workers(self, max_workers: Optional[int]) -> int:
+        """Get the number of concurrent downloads, capped at the connection pool size."""
+        # More workers than pooled connections would open extra connections that the pool
+        # then discards, paying a fresh TCP/TLS handshake for every overflowing request
+        return min(max_workers or self.max_workers, self.max_workers)
+
+    def _ensure_dir(self, output_dir: str) -> Path:
+        """Create the output directory on first use and return its path."""
+        # Expand ~ to home directory
+        output_path = Path(os.path.expanduser(output_dir))
+        if output_dir not in self._output_paths:
+            output_path.mkdir(parents=True, exist_ok=True)
+            self._output_paths.add(output_dir)
+        return output_path
+
     def _validate_patent_number(self, patent_number: str) -> None:
         """Validate patent number format."""
         if not patent_number or not isinstance(patent_number, str):
             raise InvalidPatentNumberError("Patent number must be a non-empty string")
 
-        # Basic validation - can be enhanced with more specific patterns
-        if len(patent_number.strip()) < 3:
-            raise InvalidPatentNumberError("Patent number too short")
+        # Reject malformed numbers before they cost a request to Google Patents
+        if not is_valid_patent_number(patent_number):
+            raise InvalidPatentNumberError(f"Invalid patent number format: {patent_number}")
 
     @retry_on_network_error(max_retries=3)
     def _retrieve_pdf_link(self, patent_number: str, patent_url: str) -> str:
@@ -297,15 +720,26 @@ class PatentDownloader:
             DownloadFailedError: If download fails
             NetworkError: If there's a network error
         """
+        cached = self.cache.get(patent_number, allow_stale=True)
+        if not (cached and cached.get("pdf_link")):
+            cached = None
+        elif self.cache.is_fresh(cached):
+            return cached["pdf_link"]
+
         try:
-            response = self.session.get(patent_url, timeout=self.timeout)
-            response.raise_for_status()
+            page = self._fetch_page(patent_number, patent_url, cached)
+
+            if page is None:
+                # Page unchanged since it was cached
+                self.cache.update(patent_number, **cached)
+                return cached["pdf_link"]
 
-            pdf_link = self._find_pdf_link(response.content, patent_number)
+            pdf_link = self._find_pdf_link(_ParsedPage(page["content"]), patent_number)
 
             if not pdf_link:
                 raise PatentNotFoundError(f"Could not find PDF download link for patent {patent_url}")
 
+            self.cache.update(patent_number, pdf_link=pdf_link, **self._validators(page))
             return pdf_link
 
         except requests.RequestException as e:
@@ -315,36 +749,48 @@ class PatentDownloader:
         except Exception as e:
             raise DownloadFailedError(f"Unexpected error: {e}") from e
 
-    def _find_pdf_link(self, content: bytes, patent_number: str) -> Optional[str]:
-        """Find PDF download link in the patent page."""
-        soup = BeautifulSoup(content, "html.parser")
-
-        # Try multiple strategies to find the PDF link
-        pdf_link = None
-
-        # Strategy 1: Look for download links with PDF in href
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "").lower()
-            text = link.get_text().lower()
-            if ("download" in href or "download" in text) and "pdf" in href:
-                pdf_link = link["href"]
-                break
+    def _fetch_page(self, patent_number: str, patent_url: str, cached: Optional[dict] = None) -> Optional[dict]:
+        """
+        Fetch a patent page, reusing one fetched recently and revalidating against a cached entry when given.
 
-        # Strategy 2: Look for "Download PDF" text
-        if not pdf_link:
-            for link in soup.find_all("a", href=True):
-                text = link.get_text().strip()
-                if text.lower() == "download pdf" or "download" in text.lower():
-                    pdf_link = link["href"]
-                    break
+        Returns:
+            The page entry (content plus cache validators), or None if the server reports
+            the cached page is unchanged (HTTP 304)
+        """
+        page = self._page_cache.get(patent_number)
+        if page is not None:
+            return page
+
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self.session.get(patent_url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            return None
+
+        response.raise_for_status()
+        page = {
+            "content": response.content,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        self._page_cache.update(patent_number, **page)
+        return page
+
+    def _validators(self, page: dict) -> Dict[str, Optional[str]]:
+        """Extract the cache validators for conditional requests from a fetched page."""
+        return {"etag": page["etag"], "last_modified": page["last_modified"]}
+
+    def _find_pdf_link(self, page: _ParsedPage, patent_number: str) -> Optional[str]:
+        """Find PDF download link in the patent page, only building a DOM when the regex fast path misses."""
+        pdf_link = self._match_pdf_link(page.content)
 
-        # Strategy 3: Look for download patterns in href
         if not pdf_link:
-            for link in soup.find_all("a", href=True):
-                href = link.get("href", "")
-                if "/download" in href or "download=true" in href:
-                    pdf_link = href
-                    break
+            pdf_link = self._scan_pdf_link(page.soup)
 
         # Strategy 4: Try common download URLs
         if not pdf_link:
@@ -362,50 +808,209 @@ class PatentDownloader:
 
         return pdf_link
 
+    def _match_pdf_link(self, content: bytes) -> Optional[str]:
+        """
+        Find a strategy 1 PDF download link directly in the raw HTML.
+
+        Returns None whenever the raw markup could disagree with the DOM scan (anchor text with
+        nested markup) or no strategy 1 link exists, leaving the decision to _scan_pdf_link.
+        """
+        skip_starts, skip_ends = _non_dom_spans(content)
+
+        # Strategy 1: download link with PDF in href
+        for match in _PDF_ANCHOR_RE.finditer(content):
+            i = bisect_right(skip_starts, match.start()) - 1
+            if i >= 0 and match.start() < skip_ends[i]:
+                continue  # Inside a comment or script, so not an anchor in the DOM
+            href, text = match.groups()
+            if b"download" in href.lower() or b"download" in text.lower():
+                return unescape(href.decode("utf-8", errors="replace"))
+            if content[match.end() : match.end() + 3].lower() != b"</a":
+                return None  # The rest of the anchor's text is inside nested markup
+
+        return None
+
+    def _scan_pdf_link(self, soup: BeautifulSoup) -> Optional[str]:
+        """Find the PDF download link by walking the parsed anchors."""
+        # Scan the anchors once, keeping the first match of the highest-priority strategy:
+        #   Strategy 1: download link with PDF in href (ends the scan)
+        #   Strategy 2: "Download PDF"-style link text
+        #   Strategy 3: download patterns in href
+        pdf_link = None
+        best_strategy = 4
+
+        for link in soup.find_all("a", href=True):
+            href = link["href"]
+            href_lower = href.lower()
+            text = link.get_text().lower()
+
+            if "pdf" in href_lower and ("download" in href_lower or "download" in text):
+                return href
+            if best_strategy > 2 and "download" in text:
+                pdf_link, best_strategy = href, 2
+            elif best_strategy > 3 and ("/download" in href or "download=true" in href):
+                pdf_link, best_strategy = href, 3
+
+        return pdf_link
+
     @retry_on_network_error(max_retries=3)
     def _download_pdf_data(self, pdf_link: str, patent_number: str, referer: str) -> bytes:
-        """Download the PDF data and return as bytes."""
+        """Download the PDF data and return as bytes (for callers that need it in memory)."""
         try:
-            headers = {"Referer": referer}
-
             # Use ProgressLogger if available for download progress
             if self.progress_logger:
                 self.progress_logger.log_message(f"Downloading PDF for patent {patent_number}...", "info")
             else:
                 logger.info(f"Downloading PDF data for patent {patent_number} from {pdf_link}")
 
-            pdf_response = self.session.get(pdf_link, headers=headers, timeout=self.timeout)
-            pdf_response.raise_for_status()
+            # Stream the body straight from the underlying urllib3 response, joining the chunks once at
+            # the end so the result is allocated at its exact size and never grown or copied again
+            pdf_response = self._request_pdf(pdf_link, referer)
+            try:
+                content_type = pdf_response.headers.get("content-type", "").lower()
+                pdf_data = b"".join(pdf_response.raw.stream(READ_CHUNK, decode_content=True))
+            finally:
+                pdf_response.close()
 
             # Verify it's actually a PDF
-            content_type = pdf_response.headers.get("content-type", "").lower()
-            if "pdf" not in content_type and not pdf_response.content.startswith(b"%PDF"):
+            if "pdf" not in content_type and not pdf_data.startswith(b"%PDF"):
                 warning_msg = f"Response doesn't appear to be a PDF (Content-Type: {content_type})"
                 if self.progress_logger:
                     self.progress_logger.log_message(warning_msg, "warning")
                 else:
                     logger.warning(warning_msg)
 
-            success_msg = (
-                f"Successfully downloaded PDF data for patent {patent_number} ({len(pdf_response.content)} bytes)"
-            )
+            success_msg = f"Successfully downloaded PDF data for patent {patent_number} ({len(pdf_data)} bytes)"
             if self.progress_logger:
                 self.progress_logger.log_message(success_msg, "info")
             else:
                 logger.info(success_msg)
-            return pdf_response.content
+            return pdf_data
 
         except Exception as e:
             raise DownloadFailedError(f"Failed to download PDF data: {e}") from e
 
+    @retry_on_network_error(max_retries=3)
+    def _stream_pdf_to_file(self, pdf_link: str, patent_number: str, referer: str, output_file: Path) -> int:
+        """Stream the PDF straight to disk without holding it in memory; return the number of bytes written."""
+        try:
+            # Use ProgressLogger if available for download progress
+            if self.progress_logger:
+                self.progress_logger.log_message(f"Downloading PDF for patent {patent_number}...", "info")
+            else:
+                logger.info(f"Downloading PDF for patent {patent_number} from {pdf_link}")
+
+            # Write to a temporary file next to the target and rename it into place once complete,
+            # so a failed or truncated download never leaves a partial PDF behind
+            part_file = output_file.with_name(f"{output_file.name}.{os.getpid()}.{threading.get_ident()}.part")
+            pdf_response = self._request_pdf(pdf_link, referer)
+            try:
+                content_type = pdf_response.headers.get("content-type", "").lower()
+
+                try:
+                    first_chunk, size = self._write_pdf(pdf_response, part_file)
+                except FileNotFoundError:
+                    # The output directory was removed after _ensure_dir created it; recreate it and retry
+                    output_file.parent.mkdir(parents=True, exist_ok=True)
+                    first_chunk, size = self._write_pdf(pdf_response, part_file)
+                os.replace(part_file, output_file)
+            except BaseException:
+                part_file.unlink(missing_ok=True)
+                raise
+            finally:
+                pdf_response.close()
+
+            # Verify it's actually a PDF
+            if "pdf" not in content_type and not first_chunk.startswith(b"%PDF"):
+                warning_msg = f"Response doesn't appear to be a PDF (Content-Type: {content_type})"
+                if self.progress_logger:
+                    self.progress_logger.log_message(warning_msg, "warning")
+                else:
+                    logger.warning(warning_msg)
+
+            return size
+
+        except Exception as e:
+            raise DownloadFailedError(f"Failed to download PDF: {e}") from e
+
+    def _write_pdf(self, pdf_response: requests.Response, output_file: Path) -> Tuple[bytes, int]:
+        """
+        Write a PDF body to disk.
+
+        Returns:
+            The first chunk (for verifying the PDF signature) and the number of bytes written
+        """
+        if hasattr(os, "writev"):
+            return self._writev_pdf(pdf_response, output_file)
+
+        first_chunk = b""
+        with open(output_file, "wb", buffering=READ_CHUNK) as f:
+            for chunk in pdf_response.raw.stream(READ_CHUNK, decode_content=True):
+                # Keep the first chunk around to verify the PDF signature
+                if not first_chunk:
+                    first_chunk = chunk
+                f.write(chunk)
+            return first_chunk, f.tell()
+
+    def _writev_pdf(self, pdf_response: requests.Response, output_file: Path) -> Tuple[bytes, int]:
+        """
+        Write a PDF body to disk, gathering chunks into one os.writev call per WRITE_BATCH bytes
+        (or per _IOV_MAX chunks, whichever comes first).
+
+        Returns:
+            The first chunk (for verifying the PDF signature) and the number of bytes written
+        """
+        first_chunk = b""
+        size = 0
+        batch: List[bytes] = []
+        batch_size = 0
+
+        fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            for chunk in pdf_response.raw.stream(READ_CHUNK, decode_content=True):
+                if not first_chunk:
+                    first_chunk = chunk
+                batch.append(chunk)
+                batch_size += len(chunk)
+
+                if batch_size >= WRITE_BATCH or len(batch) >= _IOV_MAX:
+                    _writev_all(fd, batch)
+                    size += batch_size
+                    batch.clear()
+                    batch_size = 0
+
+            if batch:
+                _writev_all(fd, batch)
+                size += batch_size
+        finally:
+            os.close(fd)
+
+        return first_chunk, size
+
+    def _request_pdf(self, pdf_link: str, referer: str) -> requests.Response:
+        """
+        Start a PDF download through the session without preloading the body.
+
+        Going through the session keeps its proxy, CA bundle and environment settings; callers read
+        the body from the underlying urllib3 response (``raw``) and must close the response once done.
+        """
+        headers = _pdf_request_headers(self.user_agent, referer)
+        pdf_response = self.session.get(pdf_link, headers=headers, timeout=self.timeout, stream=True)
+
+        if pdf_response.status_code >= 400:
+            pdf_response.close()
+            raise DownloadFailedError(f"HTTP {pdf_response.status_code} error for url: {pdf_link}")
+
+        # Servers that ignore "Accept-Encoding: identity" still get their content encoding undone,
+        # whichever way the body is read from raw
+        pdf_response.raw.decode_content = True
+        return pdf_response
+
     def _download_pdf(self, pdf_link: str, patent_number: str, output_path: Path, referer: str) -> bool:
         """Download the PDF file."""
         try:
-            pdf_data = self._download_pdf_data(pdf_link, patent_number, referer)
-
             output_file = output_path / f"{patent_number}.pdf"
-            with open(output_file, "wb") as f:
-                f.write(pdf_data)
+            self._stream_pdf_to_file(pdf_link, patent_number, referer, output_file)
 
             success_msg = f"Successfully downloaded {output_file}"
             if self.progress_logger:
@@ -417,80 +1022,50 @@ class PatentDownloader:
         except Exception:
             return False
 
-    def _parse_patent_info(self, content: bytes, patent_number: str, patent_url: str) -> PatentInfo:
-        """Parse patent information from the HTML content."""
-        soup = BeautifulSoup(content, "html.parser")
-
-        # Extract basic information
-        title = self._extract_title(soup)
-        inventors = self._extract_inventors(soup)
-        assignee = self._extract_assignee(soup)
-        publication_date = self._extract_publication_date(soup)
-        abstract = self._extract_abstract(soup)
-
-        return PatentInfo(
-            patent_number=patent_number,
-            title=title,
-            inventors=inventors,
-            assignee=assignee,
-            publication_date=publication_date,
-            abstract=abstract,
-            url=patent_url,
-        )
-
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """Extract patent title."""
-        title_elem = soup.find("span", itemprop="title")
-        if title_elem:
-            return title_elem.get_text().strip()
+    def _parse_patent_info(self, page: _ParsedPage, patent_number: str, patent_url: str) -> PatentInfo:
+        """Parse patent information from the patent page."""
+        return PatentInfo(patent_number=patent_number, url=patent_url, **page.as_dict())
 
-        # Fallback to h1
-        h1_elem = soup.find("h1")
-        if h1_elem:
-            return h1_elem.get_text().strip()
-
-        return "Unknown Title"
-
-    def _extract_inventors(self, soup: BeautifulSoup) -> List[str]:
-        """Extract inventor names."""
-        inventors = []
-        inventor_elems = soup.find_all("span", itemprop="inventor")
+    def __enter__(self):
+        """Context manager entry."""
+        return self
 
-        for elem in inventor_elems:
-            name = elem.get_text().strip()
-            if name:
-                inventors.append(name)
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
 
-        return inventors
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
 
-    def _extract_assignee(self, soup: BeautifulSoup) -> str:
-        """Extract assignee information."""
-        assignee_elem = soup.find("span", itemprop="assignee")
-        if assignee_elem:
-            return assignee_elem.get_text().strip()
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
 
-        return "Unknown Assignee"
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self.close()
 
-    def _extract_publication_date(self, soup: BeautifulSoup) -> str:
-        """Extract publication date."""
-        date_elem = soup.find("time", itemprop="publicationDate")
-        if date_elem:
-            return date_elem.get_text().strip()
 
-        return "Unknown Date"
+# Process-wide downloader shared by entry points that don't need custom settings
+_shared_downloader: Optional[PatentDownloader] = None
+_shared_downloader_lock = threading.Lock()
 
-    def _extract_abstract(self, soup: BeautifulSoup) -> str:
-        """Extract patent abstract."""
-        abstract_elem = soup.find("div", itemprop="abstract")
-        if abstract_elem:
-            return abstract_elem.get_text().strip()
 
-        return "No abstract available"
+def get_shared_downloader() -> PatentDownloader:
+    """
+    Get the process-wide PatentDownloader, creating it on first use.
 
-    def __enter__(self):
-        """Context manager entry."""
-        return self
+    Sharing one instance lets every caller reuse the same keep-alive connections and
+    caches. It is closed automatically when the interpreter exits.
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.session.close()
+    Returns:
+        PatentDownloader: The shared downloader with default settings
+    """
+    global _shared_downloader
+    if _shared_downloader is None:
+        with _shared_downloader_lock:
+            if _shared_downloader is None:
+                _shared_downloader = PatentDownloader()
+                atexit.register(_shared_downloader.close)
+    return _shared_downloader
@@ -2,8 +2,13 @@
 
 import os
 import csv
+import logging
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
+
+logger = logging.getLogger(__name__)
+
+_FILE_TYPE_NAMES = {".txt": "Text", ".csv": "CSV"}
 
 
 def read_patent_numbers_from_file(file_path: str, has_header: bool = False) -> List[str]:
@@ -17,6 +22,33 @@ def read_patent_numbers_from_file(file_path: str, has_header: bool = False) -> L
     Returns:
         List of patent numbers
 
+    Raises:
+        ValueError: If file format is not supported or data format is invalid
+    """
+    patent_numbers = list(iter_patent_numbers_from_file(file_path, has_header))
+
+    if not patent_numbers:
+        file_type = _FILE_TYPE_NAMES[Path(file_path).suffix.lower()]
+        raise ValueError(f"{file_type} file contains no patent numbers")
+
+    return patent_numbers
+
+
+def iter_patent_numbers_from_file(file_path: str, has_header: bool = False, strict: bool = True) -> Iterator[str]:
+    """
+    Lazily yield patent numbers from a file (txt or csv), one row at a time.
+
+    The file's existence and format are checked immediately; rows are read as the iterator is consumed.
+
+    Args:
+        file_path: Path to the file to read
+        has_header: Whether the file has a header row (for both TXT and CSV files)
+        strict: Raise on malformed CSV rows; when False they are yielded as-is (and fail validation
+            downstream) so a bad row partway through a streamed batch doesn't discard earlier results
+
+    Returns:
+        Iterator over the patent numbers
+
     Raises:
         ValueError: If file format is not supported or data format is invalid
     """
@@ -27,38 +59,27 @@ def read_patent_numbers_from_file(file_path: str, has_header: bool = False) -> L
         raise FileNotFoundError(f"File not found: {file_path}")
 
     if path.suffix.lower() == ".txt":
-        return _read_txt_file(path, has_header)
+        return _iter_txt_file(path, has_header)
     elif path.suffix.lower() == ".csv":
-        return _read_csv_file(path, has_header)
+        return _iter_csv_file(path, has_header, strict)
     else:
         raise ValueError(f"Unsupported file format: {path.suffix}. Only .txt and .csv are supported.")
 
 
-def _read_txt_file(path: Path, has_header: bool) -> List[str]:
-    """Read patent numbers from a text file."""
-    patent_numbers = []
-
+def _iter_txt_file(path: Path, has_header: bool) -> Iterator[str]:
+    """Yield patent numbers from a text file."""
     with open(path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-        if has_header and lines:
-            lines = lines[1:]  # Skip header row
+        if has_header:
+            next(f, None)  # Skip header row
 
-        for line in lines:
+        for line in f:
             line = line.strip()
             if line:  # Skip empty lines
-                patent_numbers.append(line)
-
-    if not patent_numbers:
-        raise ValueError("Text file contains no patent numbers")
-
-    return patent_numbers
-
+                yield line
 
-def _read_csv_file(path: Path, has_header: bool) -> List[str]:
-    """Read patent numbers from a CSV file."""
-    patent_numbers = []
 
+def _iter_csv_file(path: Path, has_header: bool, strict: bool = True) -> Iterator[str]:
+    """Yield patent numbers from a CSV file."""
     with open(path, "r", encoding="utf-8") as f:
         reader = csv.reader(f)
 
@@ -70,13 +91,12 @@ def _read_csv_file(path: Path, has_header: bool) -> List[str]:
                 continue  # Skip empty rows
 
             if len(row) > 1:
-                raise ValueError("CSV file must contain only one column of patent numbers")
+                if strict:
+                    raise ValueError("CSV file must contain only one column of patent numbers")
+                logger.warning(f"CSV row {reader.line_num} has more than one column: {row}")
+                yield ",".join(row)
+                continue
 
             patent_number = row[0].strip()
             if patent_number:  # Skip empty cells
-                patent_numbers.append(patent_number)
-
-    if not patent_numbers:
-        raise ValueError("CSV file contains no patent numbers")
-
-    return patent_numbers
+                yield patent_number
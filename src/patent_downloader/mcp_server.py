@@ -1,16 +1,20 @@
 """MCP (Model Context Protocol) server for patent downloader using mcp.FastMCP."""
 
+import asyncio
+import concurrent.futures
 import json
 import logging
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from mcp.server import FastMCP
 from pydantic import BaseModel, Field
 
-from .downloader import PatentDownloader
+from .downloader import get_shared_downloader, is_valid_patent_number
 from .exceptions import PatentDownloadError
+from .file_utils import read_patent_numbers_from_file
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +58,13 @@ class PatentInfoResponse(BaseModel):
     url: str = Field(..., description="URL to the patent page")
 
 
+class ClearCacheResponse(BaseModel):
+    """Response for clearing the patent cache."""
+
+    cleared: bool = Field(..., description="Whether the cache was cleared")
+    message: str = Field(..., description="Status message")
+
+
 def _get_config_path() -> Path:
     """Get the configuration file path."""
     return CONFIG_FILE
@@ -107,15 +118,26 @@ def create_mcp_server(output_dir: Optional[str] = None) -> FastMCP:
     Args:
         output_dir: Optional initial output directory. If not provided, uses config or default.
     """
-    server = FastMCP("patent-downloader")
-    downloader = PatentDownloader()
+    # One downloader serves every tool call (and anything else in the process using the shared
+    # instance), so its keep-alive connections and caches persist between calls
+    downloader = get_shared_downloader()
+    # Size the tool-call threads to the downloader's connection pool; more threads would only queue for connections
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=downloader.max_workers, thread_name_prefix="patent-dl")
+
+    @asynccontextmanager
+    async def lifespan(_server: FastMCP) -> AsyncIterator[None]:
+        """Size the thread pool used by tool calls; the shared downloader is closed at interpreter exit."""
+        asyncio.get_running_loop().set_default_executor(executor)
+        yield
+
+    server = FastMCP("patent-downloader", lifespan=lifespan)
 
     # Save to config if provided via parameter
     if output_dir is not None:
         _set_default_output_dir(output_dir)
 
     @server.tool(structured_output=True)
-    def download_patent(patent_number: str, output_dir: Optional[str] = None) -> DownloadPatentResponse:
+    async def download_patent(patent_number: str, output_dir: Optional[str] = None) -> DownloadPatentResponse:
         """Download a single patent PDF from Google Patents.
 
         Args:
@@ -135,7 +157,7 @@ def create_mcp_server(output_dir: Optional[str] = None) -> FastMCP:
             output_dir = os.path.expanduser(str(output_dir))
             Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-            success = downloader.download_patent(patent_number, output_dir)
+            success = await downloader.adownload_patent(patent_number, output_dir)
 
             if success:
                 output_path = str(Path(output_dir) / f"{patent_number}.pdf")
@@ -164,7 +186,7 @@ def create_mcp_server(output_dir: Optional[str] = None) -> FastMCP:
             )
 
     @server.tool(structured_output=True)
-    def download_patents(patent_numbers: List[str], output_dir: Optional[str] = None) -> DownloadPatentsResponse:
+    async def download_patents(patent_numbers: List[str], output_dir: Optional[str] = None) -> DownloadPatentsResponse:
         """Download multiple patent PDFs from Google Patents.
 
         Args:
@@ -184,7 +206,14 @@ def create_mcp_server(output_dir: Optional[str] = None) -> FastMCP:
             output_dir = os.path.expanduser(str(output_dir))
             Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-            results = downloader.download_patents(patent_numbers, output_dir)
+            # Drop duplicates and malformed numbers before any network I/O
+            unique = list(dict.fromkeys(patent_numbers))
+            invalid = [pn for pn in unique if not is_valid_patent_number(pn)]
+            valid = [pn for pn in unique if is_valid_patent_number(pn)]
+
+            # Run the downloads concurrently without tying up the event loop
+            results = await downloader.adownload_patents(valid, output_dir)
+            results.update(dict.fromkeys(invalid, False))
 
             successful = [pn for pn, success in results.items() if success]
             failed = [pn for pn, success in results.items() if not success]
@@ -220,7 +249,7 @@ def create_mcp_server(output_dir: Optional[str] = None) -> FastMCP:
             )
 
     @server.tool(structured_output=True)
-    def download_patents_from_file(
+    async def download_patents_from_file(
         file_path: str, has_header: bool = False, output_dir: Optional[str] = None
     ) -> DownloadPatentsResponse:
         """Download multiple patent PDFs from a file (txt or csv).
@@ -241,8 +270,8 @@ def create_mcp_server(output_dir: Optional[str] = None) -> FastMCP:
 
             # Expand ~ to home directory
             output_dir = os.path.expanduser(str(output_dir))
-            # Use the downloader's file download method
-            results = downloader.download_patents_from_file(file_path, has_header, output_dir)
+            patent_numbers = await asyncio.to_thread(read_patent_numbers_from_file, file_path, has_header)
+            results = await downloader.adownload_patents(patent_numbers, output_dir)
 
             successful = [pn for pn, success in results.items() if success]
             failed = [pn for pn, success in results.items() if not success]
@@ -298,7 +327,7 @@ def create_mcp_server(output_dir: Optional[str] = None) -> FastMCP:
             )
 
     @server.tool(structured_output=True)
-    def get_patent_info(patent_number: str) -> PatentInfoResponse:
+    async def get_patent_info(patent_number: str) -> PatentInfoResponse:
         """Get detailed information about a patent.
 
         Args:
@@ -308,7 +337,7 @@ def create_mcp_server(output_dir: Optional[str] = None) -> FastMCP:
             Response with detailed patent information
         """
         try:
-            patent_info = downloader.get_patent_info(patent_number)
+            patent_info = await downloader.aget_patent_info(patent_number)
 
             return PatentInfoResponse(
                 patent_number=patent_info.patent_number,
@@ -349,6 +378,20 @@ def create_mcp_server(output_dir: Optional[str] = None) -> FastMCP:
                 message=f"Unexpected error: {str(e)}",
             )
 
+    @server.tool(structured_output=True)
+    async def clear_cache() -> ClearCacheResponse:
+        """Clear cached patent information and pages so the next lookups fetch fresh data.
+
+        Returns:
+            Response indicating whether the cache was cleared
+        """
+        try:
+            await asyncio.to_thread(downloader.clear_cache)
+            return ClearCacheResponse(cleared=True, message="Patent cache cleared")
+        except Exception as e:
+            logger.error(f"Unexpected error clearing cache: {e}")
+            return ClearCacheResponse(cleared=False, message=f"Unexpected error: {str(e)}")
+
     return server
 
 
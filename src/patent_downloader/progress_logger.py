@@ -1,39 +1,69 @@
 """Progress bar and logging coordination utility."""
 
+import atexit
+import itertools
 import logging
+import os
+import queue
 import sys
 import threading
-from typing import Optional
+import time
+from typing import Any, List, Optional, TextIO, Tuple
+
+# Minimum number of seconds between progress bar redraws (caps the bar at 20 Hz)
+_MIN_REDRAW_INTERVAL = 0.05
+
+# Width of the progress bar in characters
+_BAR_LENGTH = 40
+
+# Filled and empty halves side by side; every bar is a _BAR_LENGTH-wide window into this string
+_FULL_BAR = "█" * _BAR_LENGTH + "░" * _BAR_LENGTH
+
+# Return to column 0 and erase the whole line (used when stdout is a terminal)
+_CLEAR_LINE = "\r\x1b[2K"
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a file descriptor, resuming after partial writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
 
 
 class ProgressLogger:
-    """Manages progress bar display and log output coordination."""
+    """Manages progress bar display and log output coordination.
+
+    Callers only enqueue updates, so worker threads never wait on the terminal. A single
+    writer thread owns stdout/stderr: it applies the queued updates in order and writes
+    everything pending in one call per stream.
+    """
 
     def __init__(self):
-        self._lock = threading.Lock()
+        self._queue: "queue.SimpleQueue[Tuple[str, Any]]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        # Display state, only touched by the writer thread
         self._current_line = ""
         self._progress_active = False
+        self._last_draw = 0.0
+        self._last_state: Optional[Tuple[int, int, str, bool]] = None
+        self._stdout_stream: Optional[TextIO] = None
+        self._stdout_fd: Optional[int] = None
         self._original_stdout = sys.stdout
         self._original_stderr = sys.stderr
 
     def start_progress(self, total: int, current: int = 0) -> None:
         """Start displaying progress bar."""
-        with self._lock:
-            self._progress_active = True
-            self._update_progress_line(current, total)
+        self._put("start", (current, total))
 
     def update_progress(self, current: int, total: int, patent_number: str = "", success: bool = True) -> None:
-        """Update progress bar display."""
-        with self._lock:
-            if self._progress_active:
-                self._update_progress_line(current, total, patent_number, success)
+        """Update progress bar display, redrawing at most every _MIN_REDRAW_INTERVAL seconds."""
+        self._put("progress", (current, total, patent_number, success))
 
     def finish_progress(self) -> None:
-        """Finish progress bar display."""
-        with self._lock:
-            if self._progress_active:
-                self._clear_current_line()
-                self._progress_active = False
+        """Finish progress bar display and wait until it has been cleared from the terminal."""
+        self._put("finish", None)
+        self.flush()
 
     def log_message(self, message: str, level: str = "info", force_show: bool = False) -> None:
         """Log message without interfering with progress bar.
@@ -61,32 +91,140 @@ class ProgressLogger:
         else:
             pass  # Display all messages
 
-        with self._lock:
+        self._put("log", (message, level))
+
+    def flush(self) -> None:
+        """Block until every queued update has been written to the terminal."""
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return
+
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        # Stop waiting if the writer thread dies instead of hanging forever
+        while not done.wait(0.1):
+            if not writer.is_alive():
+                return
+
+    def _put(self, kind: str, payload: Any) -> None:
+        """Queue an update for the writer thread, starting the thread on first use."""
+        if self._writer is None:
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._drain, name="progress-writer", daemon=True)
+                    self._writer.start()
+                    # Write out anything still queued when the interpreter exits
+                    atexit.register(self.flush)
+
+        self._queue.put((kind, payload))
+
+    def _drain(self) -> None:
+        """Writer thread: apply queued updates in batches, writing each batch with one call per stream."""
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while True:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            writes: List[Tuple[TextIO, str]] = []
+            flushed: List[threading.Event] = []
+            try:
+                self._update_stdout_fd()
+                for kind, payload in batch:
+                    if kind == "flush":
+                        flushed.append(payload)
+                    else:
+                        self._apply(kind, payload, writes)
+
+                for stream, group in itertools.groupby(writes, key=lambda write: write[0]):
+                    text = "".join(text for _, text in group)
+                    if stream is None:
+                        continue  # No console attached (e.g. pythonw, or sys.stdout set to None)
+                    if stream is sys.stdout and self._stdout_fd is not None:
+                        # Terminal output goes straight to the descriptor, skipping the text layer
+                        stream.flush()
+                        _write_all(self._stdout_fd, text.encode(stream.encoding or "utf-8", errors="replace"))
+                    else:
+                        stream.write(text)
+                        stream.flush()
+            except Exception:
+                pass  # Terminal went away or was replaced; keep draining so flush() never hangs
+            finally:
+                for done in flushed:
+                    done.set()
+
+    def _update_stdout_fd(self) -> None:
+        """Look up stdout's file descriptor if it is a POSIX terminal, re-checking only if stdout changed."""
+        if sys.stdout is self._stdout_stream:
+            return
+
+        self._stdout_stream = sys.stdout
+        if os.name == "nt":
+            # Raw bytes written to a Windows console bypass its text-layer encoding and come out garbled
+            self._stdout_fd = None
+            return
+        try:
+            self._stdout_fd = sys.stdout.fileno() if sys.stdout.isatty() else None
+        except (AttributeError, OSError, ValueError):
+            self._stdout_fd = None
+
+    def _apply(self, kind: str, payload: Any, writes: List[Tuple[TextIO, str]]) -> None:
+        """Apply one queued update to the display state, collecting the text to write."""
+        if kind == "start":
+            current, total = payload
+            self._progress_active = True
+            self._last_draw = time.monotonic()
+            writes.append((sys.stdout, self._update_progress_line(current, total)))
+
+        elif kind == "progress":
+            if self._progress_active:
+                current, total, patent_number, success = payload
+                # Always draw the final update so the bar ends at 100%
+                now = time.monotonic()
+                if now - self._last_draw < _MIN_REDRAW_INTERVAL and current != total:
+                    return
+                self._last_draw = now
+                writes.append((sys.stdout, self._update_progress_line(current, total, patent_number, success)))
+
+        elif kind == "finish":
+            if self._progress_active:
+                writes.append((sys.stdout, self._clear_current_line()))
+                self._progress_active = False
+                self._last_state = None
+
+        elif kind == "log":
+            message, level = payload
             # Clear current progress line
             if self._progress_active:
-                self._clear_current_line()
+                writes.append((sys.stdout, self._clear_current_line()))
 
             # Print log message
             if level == "error":
-                print(f"❌ {message}", file=sys.stderr)
+                writes.append((sys.stderr, f"❌ {message}\n"))
             elif level == "warning":
-                print(f"⚠️  {message}", file=sys.stderr)
+                writes.append((sys.stderr, f"⚠️  {message}\n"))
             elif level == "success":
-                print(f"✅ {message}")
+                writes.append((sys.stdout, f"✅ {message}\n"))
             else:
-                print(f"ℹ️  {message}")
+                writes.append((sys.stdout, f"ℹ️  {message}\n"))
 
             # Restore progress line
             if self._progress_active:
-                self._restore_current_line()
+                writes.append((sys.stdout, self._current_line))
+
+    def _update_progress_line(self, current: int, total: int, patent_number: str = "", success: bool = True) -> str:
+        """Update the progress bar line, returning the text to draw (empty if nothing changed)."""
+        state = (current, total, patent_number, success)
+        if state == self._last_state:
+            return ""
+        self._last_state = state
 
-    def _update_progress_line(self, current: int, total: int, patent_number: str = "", success: bool = True) -> None:
-        """Update the progress bar line."""
         if total > 0:
             percentage = int((current / total) * 100)
-            bar_length = 40
-            filled_length = int(bar_length * current // total)
-            bar = "█" * filled_length + "░" * (bar_length - filled_length)
+            filled_length = int(_BAR_LENGTH * current // total)
+            bar = _FULL_BAR[_BAR_LENGTH - filled_length : 2 * _BAR_LENGTH - filled_length]
 
             # Use unified progress icon, not changing with individual patent status
             progress_icon = "▶️"
@@ -97,15 +235,23 @@ class ProgressLogger:
         else:
             self._current_line = f"\rProgress: {current} processed"
 
-        print(self._current_line, end="", flush=True)
+        return self._current_line
+
+    def _clear_current_line(self) -> str:
+        """Get the text that clears the current line."""
+        if self._stdout_fd is not None:
+            return _CLEAR_LINE
+        return "\r" + " " * len(self._current_line) + "\r"
 
-    def _clear_current_line(self) -> None:
-        """Clear the current line."""
-        print("\r" + " " * len(self._current_line) + "\r", end="", flush=True)
 
-    def _restore_current_line(self) -> None:
-        """Restore the current progress line."""
-        print(self._current_line, end="", flush=True)
+# ProgressLogger message level for each standard logging level, highest first
+_LEVEL_TAG = {
+    logging.CRITICAL: "error",
+    logging.ERROR: "error",
+    logging.WARNING: "warning",
+    logging.INFO: "info",
+    logging.DEBUG: "debug",
+}
 
 
 class ProgressLogHandler(logging.Handler):
@@ -118,19 +264,16 @@ class ProgressLogHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
         """Emit log record through progress logger."""
         try:
-            msg = self.format(record)
-            # Use global UI level for filtering
-            ui_level = get_ui_level()
-
-            if record.levelno >= ui_level:
-                if record.levelno >= logging.ERROR:
-                    self.progress_logger.log_message(msg, "error")
-                elif record.levelno >= logging.WARNING:
-                    self.progress_logger.log_message(msg, "warning")
-                elif record.levelno >= logging.INFO:
-                    self.progress_logger.log_message(msg, "info")
-                else:
-                    self.progress_logger.log_message(msg, "debug")
+            # Use global UI level for filtering, before paying for formatting
+            if record.levelno < get_ui_level():
+                return
+
+            tag = _LEVEL_TAG.get(record.levelno)
+            if tag is None:
+                # Custom levels take the tag of the nearest standard level below them
+                tag = next((tag for level, tag in _LEVEL_TAG.items() if record.levelno >= level), "debug")
+
+            self.progress_logger.log_message(self.format(record), tag)
         except Exception:
             self.handleError(record)
 
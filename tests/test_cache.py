@@ -0,0 +1,116 @@
+"""Tests for PatentCache and the downloader's conditional (ETag/304) page lookups."""
+
+import time
+from unittest import mock
+
+from patent_downloader.cache import PatentCache
+from patent_downloader.downloader import PatentDownloader
+
+PAGE = b"""<html><body>
+<span itemprop="title">A great invention</span>
+<span itemprop="inventor">Alice</span>
+<a href="https://patentimages.storage.googleapis.com/US1234567B1.pdf">Download PDF</a>
+</body></html>"""
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise AssertionError(f"unexpected HTTP {self.status_code}")
+
+
+def test_fresh_entry_is_returned():
+    cache = PatentCache()
+    cache.update("US1234567B1", pdf_link="https://example.com/a.pdf")
+
+    entry = cache.get("US1234567B1")
+    assert entry["pdf_link"] == "https://example.com/a.pdf"
+    assert cache.is_fresh(entry)
+
+
+def test_expired_entry_is_only_returned_when_stale_allowed():
+    cache = PatentCache(ttl=60)
+    cache.update("US1234567B1", pdf_link="x")
+
+    with mock.patch("patent_downloader.cache.time.time", return_value=time.time() + 120):
+        assert cache.get("US1234567B1") is None
+        assert cache.get("US1234567B1", allow_stale=True)["pdf_link"] == "x"
+
+
+def test_update_merges_fields():
+    cache = PatentCache()
+    cache.update("US1234567B1", pdf_link="x")
+    cache.update("US1234567B1", etag='"v1"')
+
+    entry = cache.get("US1234567B1")
+    assert entry["pdf_link"] == "x"
+    assert entry["etag"] == '"v1"'
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PatentCache(maxsize=2)
+    cache.update("US1", value=1)
+    cache.update("US2", value=2)
+    cache.get("US1")  # US2 is now the least recently used
+    cache.update("US3", value=3)
+
+    assert cache.get("US1") is not None
+    assert cache.get("US2") is None
+    assert cache.get("US3") is not None
+
+
+def test_entries_persist_across_instances(tmp_path):
+    PatentCache(cache_dir=str(tmp_path)).update("US1234567B1", pdf_link="x")
+
+    assert PatentCache(cache_dir=str(tmp_path)).get("US1234567B1")["pdf_link"] == "x"
+
+
+def test_clear_removes_only_cache_entries(tmp_path):
+    config = tmp_path / "config.json"
+    config.write_text("{}")
+    cache = PatentCache(cache_dir=str(tmp_path))
+    cache.update("US1234567B1", pdf_link="x")
+
+    cache.clear()
+
+    assert cache.get("US1234567B1") is None
+    assert PatentCache(cache_dir=str(tmp_path)).get("US1234567B1") is None
+    assert config.exists()
+
+
+def test_stale_info_is_revalidated_with_etag():
+    downloader = PatentDownloader(cache_ttl=60)
+    responses = [
+        FakeResponse(200, PAGE, {"ETag": '"v1"'}),
+        FakeResponse(304),
+    ]
+    get = mock.Mock(side_effect=responses)
+    downloader.session.get = get
+
+    first = downloader.get_patent_info("US1234567B1")
+    downloader._page_cache.clear()
+    with mock.patch("patent_downloader.cache.time.time", return_value=time.time() + 120):
+        second = downloader.get_patent_info("US1234567B1")
+        assert downloader.cache.get("US1234567B1") is not None  # Refreshed by the 304
+
+    assert first == second
+    assert first.title == "A great invention"
+    assert get.call_count == 2
+    assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_fresh_info_skips_the_network():
+    downloader = PatentDownloader()
+    get = mock.Mock(return_value=FakeResponse(200, PAGE))
+    downloader.session.get = get
+
+    downloader.get_patent_info("US1234567B1")
+    downloader._page_cache.clear()
+    downloader.get_patent_info("US1234567B1")
+
+    assert get.call_count == 1
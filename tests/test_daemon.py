@@ -0,0 +1,86 @@
+"""Tests for the download daemon's socket protocol."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from patent_downloader import daemon
+from patent_downloader.downloader import PatentDownloader
+
+pytestmark = pytest.mark.skipif(not daemon.is_supported(), reason="requires Unix domain sockets")
+
+
+@pytest.fixture
+def running_daemon(tmp_path, monkeypatch):
+    """Run a daemon whose downloads succeed for US patents only, yielding its socket path; stop it afterwards."""
+    downloaded = []
+
+    def fake_download(self, patent_number, output_dir="."):
+        downloaded.append((patent_number, output_dir))
+        return patent_number.startswith("US")
+
+    monkeypatch.setattr(PatentDownloader, "download_patent", fake_download)
+    monkeypatch.setattr(daemon, "STOP_POLL_INTERVAL", 0.05)
+    path = str(tmp_path / "run" / "daemon.sock")
+    stop = threading.Event()
+    server = threading.Thread(
+        target=daemon.serve, args=(path,), kwargs={"max_workers": 2, "stop_event": stop}, daemon=True
+    )
+    server.start()
+
+    try:
+        deadline = time.monotonic() + 5
+        while not daemon.daemon_available(path):
+            assert server.is_alive() and time.monotonic() < deadline, "daemon did not start"
+            time.sleep(0.01)
+
+        yield path, downloaded
+    finally:
+        stop.set()
+        server.join(timeout=5)
+
+    assert not server.is_alive(), "daemon did not stop"
+    assert not os.path.exists(path)
+
+
+def test_round_trip(running_daemon, tmp_path):
+    path, downloaded = running_daemon
+    progress = []
+
+    results = daemon.submit_jobs(
+        ["US1234567B1", "EP1234567A1", "US1234567B1"],
+        str(tmp_path),
+        progress_callback=lambda *args: progress.append(args),
+        socket_path=path,
+    )
+
+    assert results == {"US1234567B1": True, "EP1234567A1": False}
+    assert sorted(pn for pn, _ in downloaded) == ["EP1234567A1", "US1234567B1"]
+    assert all(output_dir == str(tmp_path.resolve()) for _, output_dir in downloaded)
+    assert [(completed, total) for completed, total, _, _ in progress] == [(1, 2), (2, 2)]
+
+
+def test_socket_directory_is_private(running_daemon):
+    path, _ = running_daemon
+
+    assert os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+
+
+def test_client_refuses_socket_in_shared_directory(running_daemon):
+    path, _ = running_daemon
+    os.chmod(os.path.dirname(path), 0o755)
+
+    assert not daemon.daemon_available(path)
+    with pytest.raises(PermissionError):
+        daemon.submit_jobs(["US1234567B1"], socket_path=path)
+
+
+def test_serve_refuses_shared_directory(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o755)
+    shared.chmod(0o755)
+
+    with pytest.raises(RuntimeError):
+        daemon.serve(str(shared / "daemon.sock"))
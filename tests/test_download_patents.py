@@ -0,0 +1,85 @@
+"""Tests for batch downloads with download_patents."""
+
+import threading
+import time
+
+import pytest
+
+from patent_downloader.downloader import PatentDownloader
+
+VALID = [f"US{7000000 + i}B2" for i in range(20)]
+
+
+@pytest.fixture
+def downloader(tmp_path, monkeypatch):
+    """A downloader whose downloads take a moment and fail for EP patents, recording what was fetched."""
+    downloader = PatentDownloader(max_workers=2)
+    downloader.downloaded = []
+    downloader.finished = 0
+    lock = threading.Lock()
+
+    def fake_download(patent_number, output_dir="."):
+        time.sleep(0.005)
+        with lock:
+            downloader.downloaded.append(patent_number)
+            downloader.finished += 1
+        return not patent_number.startswith("EP")
+
+    monkeypatch.setattr(downloader, "download_patent", fake_download)
+    return downloader
+
+
+def test_generator_input_is_streamed_through_a_bounded_window(downloader, tmp_path):
+    progress = []
+    window = []
+
+    def numbers():
+        for count, patent_number in enumerate(VALID):
+            # Downloads submitted but not yet finished when the next number is requested
+            window.append(count - downloader.finished)
+            yield patent_number
+
+    results = downloader.download_patents(numbers(), str(tmp_path), progress_callback=lambda *a: progress.append(a))
+
+    assert results == dict.fromkeys(VALID, True)
+    assert max(window) <= 2 * downloader.max_workers
+    assert [completed for completed, _, _, _ in progress] == list(range(1, len(VALID) + 1))
+    assert {total for _, total, _, _ in progress} == {0}  # No known length for a generator
+
+
+def test_sized_input_reports_its_total(downloader, tmp_path):
+    progress = []
+
+    downloader.download_patents(VALID[:3], str(tmp_path), progress_callback=lambda *a: progress.append(a))
+
+    assert [(completed, total) for completed, total, _, _ in progress] == [(1, 3), (2, 3), (3, 3)]
+
+
+@pytest.mark.parametrize("as_generator", [False, True])
+def test_duplicates_are_downloaded_once(downloader, tmp_path, as_generator):
+    patent_numbers = ["US7654321B2", "EP1234567A1", "US7654321B2", "EP1234567A1"]
+    source = iter(patent_numbers) if as_generator else patent_numbers
+
+    results = downloader.download_patents(source, str(tmp_path))
+
+    assert results == {"US7654321B2": True, "EP1234567A1": False}
+    assert sorted(downloader.downloaded) == ["EP1234567A1", "US7654321B2"]
+
+
+def test_invalid_numbers_fail_without_a_download(downloader, tmp_path):
+    progress = []
+
+    results = downloader.download_patents(
+        ["US7654321B2", "not-a-patent", "EP 1234567 B1"],
+        str(tmp_path),
+        progress_callback=lambda *a: progress.append(a),
+    )
+
+    assert results == {"US7654321B2": True, "not-a-patent": False, "EP 1234567 B1": False}
+    assert downloader.downloaded == ["US7654321B2"]
+    assert len(progress) == 3
+
+
+def test_empty_input_returns_no_results(downloader, tmp_path):
+    assert downloader.download_patents([], str(tmp_path)) == {}
+    assert downloader.download_patents(iter([]), str(tmp_path)) == {}
@@ -0,0 +1,132 @@
+"""Tests for writing downloaded PDF bodies to disk."""
+
+import gzip
+import io
+import os
+
+import pytest
+import requests
+import urllib3
+
+from patent_downloader import downloader as downloader_module
+from patent_downloader.downloader import PatentDownloader
+from patent_downloader.exceptions import DownloadFailedError
+
+
+class FakeRaw:
+    """Stand-in for a urllib3 response body, served in fixed-size chunks and optionally cut short."""
+
+    def __init__(self, chunks, error=None):
+        self._chunks = list(chunks)
+        self._error = error
+
+    def stream(self, amt, decode_content=None):
+        assert decode_content, "PDF bodies must be read with their content encoding undone"
+        yield from self._chunks
+        if self._error:
+            raise self._error
+
+
+class FakeResponse:
+    def __init__(self, chunks=(), error=None, raw=None):
+        self.headers = {"content-type": "application/pdf"}
+        self.raw = raw if raw is not None else FakeRaw(chunks, error)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(params=["writev", "write"])
+def downloader(request, monkeypatch):
+    """A downloader exercising either the os.writev path or the plain file write fallback."""
+    if request.param == "write":
+        monkeypatch.delattr(os, "writev", raising=False)
+    elif not hasattr(os, "writev"):
+        pytest.skip("os.writev is not available")
+    return PatentDownloader()
+
+
+def test_many_small_chunks_are_written(downloader, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloader_module, "_IOV_MAX", 16)
+    chunks = [bytes([i % 256]) * 3 for i in range(100)]
+    output_file = tmp_path / "US1234567B1.pdf"
+
+    first_chunk, size = downloader._write_pdf(FakeResponse(chunks), output_file)
+
+    assert output_file.read_bytes() == b"".join(chunks)
+    assert size == 300
+    assert first_chunk.startswith(chunks[0])
+
+
+def test_writev_batches_respect_iov_max(tmp_path, monkeypatch):
+    if not hasattr(os, "writev"):
+        pytest.skip("os.writev is not available")
+    monkeypatch.setattr(downloader_module, "_IOV_MAX", 16)
+    batch_sizes = []
+    real_writev = os.writev
+
+    def recording_writev(fd, buffers):
+        batch_sizes.append(len(buffers))
+        return real_writev(fd, buffers)
+
+    monkeypatch.setattr(os, "writev", recording_writev)
+    PatentDownloader()._writev_pdf(FakeResponse([b"x"] * 100), tmp_path / "out.pdf")
+
+    assert max(batch_sizes) <= 16
+
+
+def test_truncated_body_leaves_no_file(downloader, tmp_path, monkeypatch):
+    response = FakeResponse([b"%PDF-1.4 partial"], error=ConnectionError("connection dropped"))
+    monkeypatch.setattr(downloader, "_request_pdf", lambda pdf_link, referer: response)
+    output_file = tmp_path / "US1234567B1.pdf"
+
+    with pytest.raises(DownloadFailedError):
+        downloader._stream_pdf_to_file.__wrapped__(downloader, "https://x/a.pdf", "US1234567B1", "", output_file)
+
+    assert list(tmp_path.iterdir()) == []
+    assert response.closed
+
+
+def test_deleted_output_directory_is_recreated(downloader, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloader, "_request_pdf", lambda pdf_link, referer: FakeResponse([b"%PDF-1.4"]))
+    output_dir = tmp_path / "out"
+    downloader._ensure_dir(str(output_dir))
+    output_dir.rmdir()
+
+    downloader._stream_pdf_to_file.__wrapped__(downloader, "https://x/a.pdf", "US1234567B1", "", output_dir / "a.pdf")
+
+    assert (output_dir / "a.pdf").read_bytes() == b"%PDF-1.4"
+
+
+def gzip_response(body):
+    """A real urllib3 response carrying a gzip-encoded body, as sent by a server ignoring "identity"."""
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(gzip.compress(body)),
+        headers={"Content-Encoding": "gzip", "Content-Type": "application/pdf"},
+        status=200,
+        preload_content=False,
+        decode_content=False,  # As requests' adapter builds it
+    )
+
+
+def test_gzip_encoded_body_is_decoded(downloader, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloader_module, "READ_CHUNK", 1024)
+    body = b"%PDF-1.4\n" + os.urandom(10_000)
+    output_file = tmp_path / "US1234567B1.pdf"
+
+    first_chunk, size = downloader._write_pdf(FakeResponse(raw=gzip_response(body)), output_file)
+
+    assert output_file.read_bytes() == body
+    assert size == len(body)
+    assert first_chunk.startswith(b"%PDF")
+
+
+def test_request_pdf_decodes_content(monkeypatch):
+    downloader = PatentDownloader()
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = gzip_response(b"%PDF-1.4")
+    monkeypatch.setattr(downloader.session, "get", lambda *args, **kwargs: response)
+
+    assert downloader._request_pdf("https://x/a.pdf", "").raw.decode_content
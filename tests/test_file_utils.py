@@ -0,0 +1,37 @@
+"""Tests for reading patent numbers from files."""
+
+from unittest import mock
+
+import pytest
+
+from patent_downloader.downloader import PatentDownloader
+from patent_downloader.file_utils import iter_patent_numbers_from_file, read_patent_numbers_from_file
+
+
+def test_read_csv_rejects_multiple_columns(tmp_path):
+    path = tmp_path / "patents.csv"
+    path.write_text("US1234567B1\nUS1,US2\n")
+
+    with pytest.raises(ValueError, match="only one column"):
+        read_patent_numbers_from_file(str(path))
+
+
+def test_non_strict_iteration_yields_malformed_rows(tmp_path):
+    path = tmp_path / "patents.csv"
+    path.write_text("number\nUS1234567B1\nUS1,US2\nEP1234567A1\n")
+
+    numbers = list(iter_patent_numbers_from_file(str(path), has_header=True, strict=False))
+
+    assert numbers == ["US1234567B1", "US1,US2", "EP1234567A1"]
+
+
+def test_malformed_row_is_recorded_as_failure(tmp_path):
+    path = tmp_path / "patents.csv"
+    path.write_text("US1234567B1\nUS1,US2\nEP1234567A1\n")
+    downloader = PatentDownloader()
+
+    with mock.patch.object(PatentDownloader, "download_patent", return_value=True) as download_patent:
+        results = downloader.download_patents_from_file(str(path), output_dir=str(tmp_path))
+
+    assert results == {"US1234567B1": True, "US1,US2": False, "EP1234567A1": True}
+    assert sorted(call.args[0] for call in download_patent.call_args_list) == ["EP1234567A1", "US1234567B1"]
@@ -0,0 +1,62 @@
+"""Tests that the streaming patent page parser matches the BeautifulSoup extractors."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from patent_downloader.downloader import HTML_PARSER, _ParsedPage
+
+PAGES = [
+    b"""<html><body><h1>Header</h1>
+    <span itemprop="title">A great invention</span>
+    <span itemprop="inventor">Alice</span><span itemprop="inventor">Bob</span>
+    <span itemprop="assignee">ACME</span>
+    <time itemprop="publicationDate">2013-05-30</time>
+    <div itemprop="abstract"><div class="abstract">Does things.</div><div>More things.</div></div>
+    </body></html>""",
+    b"<h1>Only <i>h1</i></h1>",
+    b'<span itemprop="title">T &amp; <span>nested</span> x</span><span itemprop="title">second</span>',
+    b'<span itemprop="inventor"> </span><span itemprop="inventor">C&eacute;</span>',
+    b'<div itemprop="abstract"><div>a<br/>b</div><p>c<img src=x>d</div>tail',
+    b'<div itemprop="abstract">unclosed <b>bold',
+    b'<div itemprop="abstract">A<script>var x = "</div>";</script><style>.a{}</style><template>T</template>B</div>',
+    b'<dl><dd><span itemprop="title">Foo</dd><dd><span itemprop="assignee">Acme</dd></dl><p>after</p>',
+    b'<div><span itemprop="inventor">Ann<div>x</div></div><span itemprop="inventor">Bob</span>',
+    b'<span itemprop="title"/>Real<h1>H</h1>',
+    b'<time itemprop="publicationDate">2020</b>-01</time>',
+    b"",
+]
+
+
+def soup_fields(content):
+    """Extract the patent fields the way the DOM-based implementation does."""
+    soup = BeautifulSoup(content, HTML_PARSER)
+
+    title = soup.find("span", itemprop="title") or soup.find("h1")
+    inventors = [e.get_text().strip() for e in soup.find_all("span", itemprop="inventor")]
+    assignee = soup.find("span", itemprop="assignee")
+    date = soup.find("time", itemprop="publicationDate")
+    abstract = soup.find("div", itemprop="abstract")
+    return {
+        "title": title.get_text().strip() if title else "Unknown Title",
+        "inventors": [name for name in inventors if name],
+        "assignee": assignee.get_text().strip() if assignee else "Unknown Assignee",
+        "publication_date": date.get_text().strip() if date else "Unknown Date",
+        "abstract": abstract.get_text().strip() if abstract else "No abstract available",
+    }
+
+
+@pytest.mark.parametrize("content", PAGES)
+def test_matches_soup_extraction(content):
+    assert _ParsedPage(content).as_dict() == soup_fields(content)
+
+
+def test_script_and_style_text_is_skipped():
+    page = _ParsedPage(b'<div itemprop="abstract">Before<script>alert(1)</script><style>p{}</style> after</div>')
+
+    assert page.abstract == "Before after"
+
+
+def test_unclosed_element_ends_with_its_parent():
+    page = _ParsedPage(b'<p><span itemprop="assignee">ACME</p><div>Footer text</div>')
+
+    assert page.assignee == "ACME"
@@ -0,0 +1,91 @@
+"""Tests for locating the PDF download link on a patent page."""
+
+import random
+import time
+
+import pytest
+
+from patent_downloader.downloader import PatentDownloader, _ParsedPage
+
+ANCHORS = [
+    b'<a href="/a.pdf">Download</a>',
+    b'<a href="/a.pdf">x</a>',
+    b'<a href="/b.pdf"><i>Download</i></a>',
+    b'<a href="/b.pdf">Get <i>it</i></a>',
+    b'<a href="/c/download.pdf">c</a>',
+    b'<a class="x" href="/C.PDF">DOWNLOAD</a>',
+    b'<a href="/d">download now</a>',
+    b'<a href="/e"><span>get</span> Download</a>',
+    b'<a href="/f">Down<b>load</b></a>',
+    b'<a href="/g/download">g</a>',
+    b'<a href="/h?download=true">h</a>',
+    b'<a href="/i.pdf">unclosed ',
+    b'<!-- <a href="/j.pdf">download</a> -->',
+    b"<script>var s = '<a href=\"/k.pdf\">download</a>';</script>",
+    b"<p>text</p>",
+    b'<a href="/l">l</a>',
+    b"<a>no href download</a>",
+]
+
+
+@pytest.fixture(scope="module")
+def downloader():
+    return PatentDownloader()
+
+
+def find(downloader, content):
+    """Run both the raw-HTML fast path and the DOM scan on a page."""
+    return downloader._match_pdf_link(content), downloader._scan_pdf_link(_ParsedPage(content).soup)
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (b'<a href="https://x/US1.pdf" itemprop="pdfLink">Download PDF</a>', "https://x/US1.pdf"),
+        (b'<a href="/a.pdf"><span>Download</span></a><a href="/b.pdf">download</a>', "/a.pdf"),
+        (b'<!-- <a href="/old.pdf">Download</a> --><a href="/new.pdf">Download</a>', "/new.pdf"),
+        (b'<a href="/a">Down<b>load</b></a> <a href="/b">Download</a>', "/a"),
+        (b'<a href="/p">Download PDF</a><a href="/x/download">x</a>', "/p"),
+        (b'<a href="/x/download">x</a>', "/x/download"),
+        (b'<a href="/x?a=1&amp;download=true">x</a>', "/x?a=1&download=true"),
+        (b'<a href="/x">x</a>', None),
+    ],
+)
+def test_fast_path_agrees_with_dom(downloader, content, expected):
+    fast, dom = find(downloader, content)
+
+    assert dom == expected
+    assert fast in (None, dom)
+
+
+def test_randomised_parity_with_dom(downloader):
+    rng = random.Random(1)
+    answered = 0
+
+    for _ in range(3000):
+        content = b"".join(rng.choice(ANCHORS) for _ in range(rng.randint(0, 6)))
+        fast, dom = find(downloader, content)
+        if fast is not None:
+            answered += 1
+            assert fast == dom, content
+
+    assert answered > 500  # The fast path still answers the common cases
+
+
+def test_fast_path_is_linear_on_unclosed_nested_anchors(downloader):
+    content = b'<a href="x"><span>t</span> text<p>filler</p>\n' * 3000
+
+    start = time.perf_counter()
+    assert downloader._match_pdf_link(content) is None
+    assert time.perf_counter() - start < 1
+
+
+def test_find_pdf_link_normalizes_and_falls_back(downloader):
+    page = _ParsedPage(b'<a href="/patent/US1/download.pdf">Download</a>')
+    assert downloader._find_pdf_link(page, "US1") == "https://patents.google.com/patent/US1/download.pdf"
+
+    page = _ParsedPage(b'<a href="pdfs/US1.pdf">Download</a>')
+    assert downloader._find_pdf_link(page, "US1") == "https://patents.google.com/pdfs/US1.pdf"
+
+    page = _ParsedPage(b"<p>No links</p>")
+    assert downloader._find_pdf_link(page, "US1") == "https://patents.google.com/patent/US1/en/download"
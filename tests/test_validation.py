@@ -0,0 +1,65 @@
+"""Tests for the accepted patent publication number formats."""
+
+import pytest
+
+from patent_downloader.downloader import PatentDownloader, is_valid_patent_number
+from patent_downloader.exceptions import InvalidPatentNumberError
+
+
+@pytest.mark.parametrize(
+    "patent_number",
+    [
+        "US7654321B2",  # US granted patent
+        "US7654321",  # Without kind code
+        "US20130123448A1",  # US pre-grant publication
+        "USRE49851E1",  # US reissue
+        "USPP12345P2",  # US plant patent
+        "USD900000S",  # US design patent
+        "USD12345S",
+        "EP1234567B1",
+        "EP1234567A1",
+        "WO2013078254A1",  # WO with four-digit year
+        "WO9912345A1",  # WO with two-digit year
+        "CN102123456A",
+        "CN202012345U",  # Chinese utility model
+        "JP2015123456A",
+        "JPH0812345A",  # Japanese Heisei-era publication
+        "JPS6012345A",  # Japanese Showa-era publication
+        "KR1020150123456A",  # 13-digit Korean application publication
+        "KR101234567B1",
+        "DE102010012345A1",
+        "GB2345678A",
+        "FR2912345A1",
+        " us7654321b2 ",  # Case and surrounding whitespace are ignored
+    ],
+)
+def test_accepts_publication_numbers(patent_number):
+    assert is_valid_patent_number(patent_number)
+
+
+@pytest.mark.parametrize(
+    "patent_number",
+    [
+        "",
+        "US",
+        "US123",  # Too few digits
+        "USD123S",
+        "1234567",  # No country code
+        "EP 1234567 B1",  # Spaces inside the number
+        "US-7654321-B2",  # Dashes
+        "US2013/0123448",  # Slashes
+        "US7654321B2X",  # Trailing garbage after the kind code
+        "not a patent",
+        None,
+        7654321,
+    ],
+)
+def test_rejects_malformed_numbers(patent_number):
+    assert not is_valid_patent_number(patent_number)
+
+
+def test_malformed_number_raises_before_any_request():
+    downloader = PatentDownloader()
+
+    with pytest.raises(InvalidPatentNumberError):
+        downloader._validate_patent_number("EP 1234567 B1")